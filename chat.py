@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Non-streaming chat script for AWS Bedrock Chat."""
 
+import argparse
 import sys
 import time
 import logging
@@ -23,43 +24,49 @@ def list_available_models():
         print(f"- {name:<15} ({model_id})")
     print()
 
-def validate_args(args: list) -> tuple[str, str, Optional[int], Optional[float]]:
-    """Validate command line arguments."""
-    if len(args) < 2 or args[1] in ['-h', '--help']:
-        print("Usage: python chat.py \"<prompt>\" <model> [max_tokens] [temperature]")
-        print("\nExample: python chat.py \"Tell me a joke\" claude-haiku 100 0.7")
-        print("\nUse --list to see available models")
-        sys.exit(0)
+class ListModelsAction(argparse.Action):
+    """List available models and exit, like --help."""
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help=None):
+        super().__init__(option_strings, dest=dest, default=default, nargs=0, help=help)
         
-    if args[1] == '--list':
+    def __call__(self, parser, namespace, values, option_string=None):
         list_available_models()
-        sys.exit(0)
-        
-    if len(args) < 3:
-        print("Error: Both prompt and model name are required")
-        print("Use --help for usage information")
-        sys.exit(1)
-        
-    prompt = args[1]
-    model = args[2]
-    
+        parser.exit()
+
+def positive_int(value: str) -> int:
+    """Parse a positive integer argument."""
     try:
-        max_tokens = int(args[3]) if len(args) > 3 else 100
-        if max_tokens < 1:
-            raise ValueError("max_tokens must be positive")
-    except ValueError as e:
-        print(f"Error: Invalid max_tokens value - {str(e)}")
-        sys.exit(1)
-        
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError("max_tokens must be positive")
+    return number
+
+def temperature_float(value: str) -> float:
+    """Parse a temperature argument between 0 and 1."""
     try:
-        temperature = float(args[4]) if len(args) > 4 else 0.7
-        if not 0 <= temperature <= 1:
-            raise ValueError("temperature must be between 0 and 1")
-    except ValueError as e:
-        print(f"Error: Invalid temperature value - {str(e)}")
-        sys.exit(1)
-        
-    return prompt, model, max_tokens, temperature
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid float value: '{value}'")
+    if not 0 <= number <= 1:
+        raise argparse.ArgumentTypeError("temperature must be between 0 and 1")
+    return number
+
+parser = argparse.ArgumentParser(
+    description="Chat with an AWS Bedrock model.",
+    epilog='Example: python chat.py "Tell me a joke" claude-haiku 100 0.7'
+)
+parser.add_argument('prompt', help="prompt to send to the model")
+parser.add_argument('model', help="short model name (see --list)")
+parser.add_argument('max_tokens', nargs='?', type=positive_int, default=100, help="maximum tokens to generate (default: 100)")
+parser.add_argument('temperature', nargs='?', type=temperature_float, default=0.7, help="sampling temperature between 0 and 1 (default: 0.7)")
+parser.add_argument('--list', action=ListModelsAction, help="list available models and exit")
+
+def validate_args(args: list) -> tuple[str, str, Optional[int], Optional[float]]:
+    """Validate command line arguments."""
+    parsed = parser.parse_args(args[1:])
+    return parsed.prompt, parsed.model, parsed.max_tokens, parsed.temperature
 
 def main():
     """Main entry point."""
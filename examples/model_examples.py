@@ -1,107 +1,170 @@
 """Examples of using different models with AWS Bedrock Chat."""
 
-from src.bedrock_chat.cli import chat_command, stream_chat_command
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from src.bedrock_chat.cli import chat_command, stream_chat_command, achat_command, astream_chat_command
 from src.bedrock_chat.models import ModelConfig, StreamConfig
 
+# Bound concurrent requests to avoid Bedrock ThrottlingException
+MAX_CONCURRENT_REQUESTS = 8
+
 def claude_examples():
     """Examples using Claude models."""
-    print("\n=== Claude Models Examples ===")
-    
-    # Basic chat with Claude Sonnet
-    print("\n1. Basic Chat with Claude Sonnet:")
-    chat_command(
-        prompt="Explain what is quantum computing in simple terms",
-        model_name="claude-sonnet"
-    )
-    
-    # Streaming chat with Claude Haiku
-    print("\n2. Streaming Chat with Claude Haiku:")
-    stream_chat_command(
-        prompt="Write a haiku about spring",
-        model_name="claude-haiku",
-        max_tokens=50,
-        temperature=0.8
-    )
-    
-    # Long-form content with Claude 2.1
-    print("\n3. Long-form Content with Claude 2.1:")
-    chat_command(
-        prompt="Write a detailed analysis of climate change impacts",
-        model_name="claude-2.1",
-        max_tokens=1000,
-        temperature=0.7
-    )
+    chat = [
+        # Basic chat with Claude Sonnet
+        dict(
+            prompt="Explain what is quantum computing in simple terms",
+            model_name="claude-sonnet"
+        ),
+        # Long-form content with Claude 2.1
+        dict(
+            prompt="Write a detailed analysis of climate change impacts",
+            model_name="claude-2.1",
+            max_tokens=1000,
+            temperature=0.7
+        )
+    ]
+    stream = [
+        # Streaming chat with Claude Haiku
+        dict(
+            prompt="Write a haiku about spring",
+            model_name="claude-haiku",
+            max_tokens=50,
+            temperature=0.8
+        )
+    ]
+    return chat, stream
 
 def titan_examples():
     """Examples using Amazon Titan models."""
-    print("\n=== Titan Models Examples ===")
-    
-    # Quick response with Titan Express
-    print("\n1. Quick Response with Titan Express:")
-    chat_command(
-        prompt="Give me 3 quick tips for productivity",
-        model_name="titan-express",
-        max_tokens=100
-    )
-    
-    # Creative writing with Titan Lite
-    print("\n2. Creative Writing with Titan Lite:")
-    stream_chat_command(
-        prompt="Write a short story about a robot learning to paint",
-        model_name="titan-lite",
-        max_tokens=200,
-        temperature=0.9
-    )
+    chat = [
+        # Quick response with Titan Express
+        dict(
+            prompt="Give me 3 quick tips for productivity",
+            model_name="titan-express",
+            max_tokens=100
+        )
+    ]
+    stream = [
+        # Creative writing with Titan Lite
+        dict(
+            prompt="Write a short story about a robot learning to paint",
+            model_name="titan-lite",
+            max_tokens=200,
+            temperature=0.9
+        )
+    ]
+    return chat, stream
 
 def llama_examples():
     """Examples using Llama models."""
-    print("\n=== Llama Models Examples ===")
-    
-    # Complex reasoning with Llama 70B
-    print("\n1. Complex Reasoning with Llama 70B:")
-    chat_command(
-        prompt="Explain the concept of blockchain and its potential applications",
-        model_name="llama-70b",
-        max_tokens=500
-    )
-    
-    # Creative task with Llama 8B
-    print("\n2. Creative Task with Llama 8B:")
-    stream_chat_command(
-        prompt="Create a fantasy character description",
-        model_name="llama-8b",
-        max_tokens=150,
-        temperature=0.85
-    )
+    chat = [
+        # Complex reasoning with Llama 70B
+        dict(
+            prompt="Explain the concept of blockchain and its potential applications",
+            model_name="llama-70b",
+            max_tokens=500
+        )
+    ]
+    stream = [
+        # Creative task with Llama 8B
+        dict(
+            prompt="Create a fantasy character description",
+            model_name="llama-8b",
+            max_tokens=150,
+            temperature=0.85
+        )
+    ]
+    return chat, stream
 
 def mistral_examples():
     """Examples using Mistral models."""
-    print("\n=== Mistral Models Examples ===")
-    
-    # Technical explanation with Mistral Large
-    print("\n1. Technical Explanation with Mistral Large:")
-    chat_command(
-        prompt="Explain how neural networks learn and adapt",
-        model_name="mistral-large",
-        max_tokens=300
-    )
-    
-    # Code generation with Mistral 7B
-    print("\n2. Code Generation with Mistral 7B:")
-    stream_chat_command(
-        prompt="Write a Python function to calculate Fibonacci numbers",
-        model_name="mistral-7b",
-        max_tokens=200,
-        temperature=0.3
+    chat = [
+        # Technical explanation with Mistral Large
+        dict(
+            prompt="Explain how neural networks learn and adapt",
+            model_name="mistral-large",
+            max_tokens=300
+        ),
+        # Multi-task with Mistral 8x7B
+        dict(
+            prompt="1. Summarize the theory of relativity\n2. List its key equations\n3. Explain practical applications",
+            model_name="mistral-8x7b",
+            max_tokens=800
+        )
+    ]
+    stream = [
+        # Code generation with Mistral 7B
+        dict(
+            prompt="Write a Python function to calculate Fibonacci numbers",
+            model_name="mistral-7b",
+            max_tokens=200,
+            temperature=0.3
+        )
+    ]
+    return chat, stream
+
+def collect_requests():
+    """Collect non-streaming and streaming example requests from every model family."""
+    chat_requests = []
+    stream_requests = []
+    for examples in (claude_examples, titan_examples, llama_examples, mistral_examples):
+        chat, stream = examples()
+        chat_requests.extend(chat)
+        stream_requests.extend(stream)
+    return chat_requests, stream_requests
+
+def report_failures(requests, results):
+    """Print the requests that failed."""
+    for request, result in zip(requests, results):
+        if isinstance(result, Exception):
+            print(f"{request['model_name']} failed: {result}")
+
+async def run_examples():
+    """Run all model examples, with non-streaming requests issued concurrently."""
+    chat_requests, stream_requests = collect_requests()
+    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    
+    async def bounded(request):
+        async with sem:
+            return await achat_command(**request)
+    
+    print("\n=== Concurrent Chat Examples ===")
+    results = await asyncio.gather(
+        *(bounded(request) for request in chat_requests),
+        return_exceptions=True
     )
+    report_failures(chat_requests, results)
     
-    # Multi-task with Mistral 8x7B
-    print("\n3. Multi-task with Mistral 8x7B:")
-    chat_command(
-        prompt="1. Summarize the theory of relativity\n2. List its key equations\n3. Explain practical applications",
-        model_name="mistral-8x7b",
-        max_tokens=800
-    )
+    # Streaming output interleaves, so streams run one at a time
+    print("\n=== Streaming Examples ===")
+    for request in stream_requests:
+        await astream_chat_command(**request)
+
+def run_examples_threaded():
+    """Run all model examples, with non-streaming requests issued from a thread pool.
+    
+    Used when aioboto3 is not installed. The shared boto3 client is
+    thread-safe and releases the GIL while waiting on the network.
+    """
+    chat_requests, stream_requests = collect_requests()
+    
+    def run(request):
+        try:
+            return chat_command(**request)
+        except Exception as e:
+            return e
+    
+    print("\n=== Concurrent Chat Examples ===")
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        results = list(executor.map(run, chat_requests))
+    report_failures(chat_requests, results)
+    
+    # Streaming output interleaves, so streams run one at a time
+    print("\n=== Streaming Examples ===")
+    for request in stream_requests:
+        stream_chat_command(**request)
 
 def advanced_examples():
     """Advanced usage examples."""
@@ -142,10 +205,12 @@ if __name__ == "__main__":
     print("Running AWS Bedrock Chat Examples...")
     
     # Run individual model examples
-    claude_examples()
-    titan_examples()
-    llama_examples()
-    mistral_examples()
+    try:
+        import aioboto3  # noqa: F401
+    except ImportError:
+        run_examples_threaded()
+    else:
+        asyncio.run(run_examples())
     
     # Run advanced examples
     advanced_examples()
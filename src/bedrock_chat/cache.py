@@ -0,0 +1,227 @@
+"""Response caching for AWS Bedrock Chat."""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+from .utils.serialization import dumps, loads
+
+EmbedFn = Callable[[str], Sequence[float]]
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapse whitespace so trivially different prompts share a cache key."""
+    return " ".join(prompt.split())
+
+def make_cache_key(
+    model_id: str,
+    prompt: str,
+    system_prompt: Optional[str] = None,
+    max_tokens: int = 100,
+    temperature: float = 0.7
+) -> str:
+    """Build a cache key for a chat request.
+    
+    Args:
+        model_id: Full Bedrock model ID
+        prompt: User prompt
+        system_prompt: Optional system instructions
+        max_tokens: Maximum tokens to generate
+        temperature: Temperature for response generation
+    
+    Returns:
+        Hex digest identifying the request
+    """
+    payload = {
+        "model_id": model_id,
+        "system_prompt": system_prompt,
+        "prompt": normalize_prompt(prompt),
+        "max_tokens": max_tokens,
+        "temperature": temperature
+    }
+    return hashlib.blake2b(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+class ResponseCache:
+    """LRU cache of model responses with optional persistence and semantic lookup.
+    
+    Exact matches are served from an in-memory LRU (and a ``diskcache`` store
+    when ``directory`` is given). When ``embed_fn`` is provided, misses fall
+    back to a cosine-similarity search over previously cached prompts sharing
+    the same model, system prompt and generation parameters.
+    """
+    
+    def __init__(
+        self,
+        maxsize: int = 256,
+        directory: Optional[str] = None,
+        embed_fn: Optional[EmbedFn] = None,
+        similarity_threshold: float = 0.97,
+        max_semantic_temperature: float = 0.3
+    ):
+        if maxsize < 1:
+            raise ValueError("Cache size must be positive")
+        if not 0 < similarity_threshold <= 1:
+            raise ValueError("Similarity threshold must be between 0 and 1")
+        
+        self.maxsize = maxsize
+        self.embed_fn = embed_fn
+        self.similarity_threshold = similarity_threshold
+        self.max_semantic_temperature = max_semantic_temperature
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._semantic: Dict[str, Tuple[List[str], Optional["np.ndarray"]]] = {}
+        # Query vectors from semantic misses, reused when the response is stored
+        self._query_vectors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._disk = None
+        
+        # Optional dependencies are imported only when their feature is used
+        if directory is not None:
+            try:
+                import diskcache
+            except ImportError as e:
+                raise ImportError("diskcache is required for persistent caching") from e
+            self._disk = diskcache.Cache(directory)
+        if embed_fn is not None:
+            try:
+                import numpy
+            except ImportError as e:
+                raise ImportError("numpy is required for semantic caching") from e
+            self._np = numpy
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached response by exact key."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                return value
+        if self._disk is not None:
+            value = self._disk.get(key)
+            if value is not None:
+                self._remember(key, value)
+        return value
+    
+    def set(self, key: str, value: str):
+        """Store a response under an exact key."""
+        self._remember(key, value)
+        if self._disk is not None:
+            self._disk.set(key, value)
+    
+    def clear(self):
+        """Clear all cached responses."""
+        with self._lock:
+            self._entries.clear()
+            self._semantic.clear()
+            self._query_vectors.clear()
+        if self._disk is not None:
+            self._disk.clear()
+    
+    def lookup(
+        self,
+        model_id: str,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 100,
+        temperature: float = 0.7
+    ) -> Optional[str]:
+        """Find a cached response for a request, exact match first.
+        
+        Returns:
+            Cached response text if found, None otherwise
+        """
+        key = make_cache_key(model_id, prompt, system_prompt, max_tokens, temperature)
+        value = self.get(key)
+        if value is not None or not self._semantic_enabled(temperature):
+            return value
+        
+        scope = make_cache_key(model_id, "", system_prompt, max_tokens, temperature)
+        with self._lock:
+            responses, matrix = self._semantic.get(scope, ([], None))
+        if matrix is None:
+            return None
+        
+        query = self._embed(prompt)
+        scores = matrix @ query
+        best = int(scores.argmax())
+        if scores[best] >= self.similarity_threshold:
+            return responses[best]
+        with self._lock:
+            self._query_vectors[normalize_prompt(prompt)] = query
+            if len(self._query_vectors) > self.maxsize:
+                self._query_vectors.popitem(last=False)
+        return None
+    
+    def store(
+        self,
+        model_id: str,
+        prompt: str,
+        response: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 100,
+        temperature: float = 0.7
+    ):
+        """Cache a response for a request."""
+        key = make_cache_key(model_id, prompt, system_prompt, max_tokens, temperature)
+        self.set(key, response)
+        if not self._semantic_enabled(temperature):
+            return
+        
+        scope = make_cache_key(model_id, "", system_prompt, max_tokens, temperature)
+        with self._lock:
+            query = self._query_vectors.pop(normalize_prompt(prompt), None)
+        if query is None:
+            query = self._embed(prompt)
+        row = query[self._np.newaxis, :]
+        with self._lock:
+            responses, matrix = self._semantic.get(scope, ([], None))
+            responses = (responses + [response])[-self.maxsize:]
+            matrix = row if matrix is None else self._np.vstack((matrix, row))[-self.maxsize:]
+            self._semantic[scope] = (responses, matrix)
+    
+    def _remember(self, key: str, value: str):
+        """Insert into the in-memory LRU, evicting the oldest entry if full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def _semantic_enabled(self, temperature: float) -> bool:
+        """Semantic hits are only safe for near-deterministic requests."""
+        return self.embed_fn is not None and temperature <= self.max_semantic_temperature
+    
+    def _embed(self, prompt: str) -> "np.ndarray":
+        """Embed a prompt as a unit-length float32 vector."""
+        vector = self._np.asarray(self.embed_fn(normalize_prompt(prompt)), dtype=self._np.float32)
+        norm = self._np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+def titan_embedder(client=None, model_id: str = "amazon.titan-embed-text-v1") -> EmbedFn:
+    """Create an embedding function backed by Bedrock Titan Embeddings.
+    
+    Args:
+        client: Optional Bedrock runtime client
+        model_id: Embedding model ID
+    
+    Returns:
+        Function mapping text to an embedding vector
+    """
+    if client is None:
+        from .utils import get_bedrock_client
+        client = get_bedrock_client()
+    
+    def embed(text: str) -> Sequence[float]:
+        response = client.invoke_model(
+            modelId=model_id,
+            body=dumps({"inputText": text})
+        )
+        return loads(response['body'].read())['embedding']
+    
+    return embed
@@ -1,6 +1,27 @@
 """Command-line interface for AWS Bedrock Chat."""
 
-from .chat import chat_command, stream_chat_command
 from .models import list_models_command
 
-__all__ = ['chat_command', 'stream_chat_command', 'list_models_command']
+__all__ = [
+    'chat_command',
+    'stream_chat_command',
+    'achat_command',
+    'astream_chat_command',
+    'ChatResult',
+    'list_models_command'
+]
+
+_CHAT_COMMANDS = frozenset((
+    'chat_command',
+    'stream_chat_command',
+    'achat_command',
+    'astream_chat_command',
+    'ChatResult'
+))
+
+def __getattr__(name: str):
+    """Import chat commands on first access to keep CLI startup fast."""
+    if name in _CHAT_COMMANDS:
+        from . import chat
+        return getattr(chat, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,35 +1,124 @@
 """Chat commands for AWS Bedrock Chat CLI."""
 
-import json
 import sys
 import time
-from typing import Optional, Dict, Any, List, Union
-from botocore.exceptions import ClientError
+from collections import deque
+from itertools import islice
+from typing import TYPE_CHECKING, Optional, Deque, Dict, Any, List, Tuple, Union
 
-from ..models import ModelConfig, StreamConfig, get_model_id, get_model_info
-from ..utils import get_bedrock_client, process_stream_chunks, handle_rate_limit
+from ..cache import ResponseCache
+from ..models import ModelConfig, ModelInfo, StreamConfig, get_model_id, get_model_info
+from ..models.model_config import TEXT_PROMPT_FAMILIES
+from ..utils import (
+    EXTRACTORS,
+    get_bedrock_client,
+    get_async_bedrock_client,
+    invalidate_runtime_client,
+    is_stale_connection_error,
+    process_stream_chunks,
+    process_stream_chunks_async,
+    handle_rate_limit,
+    handle_rate_limit_async,
+    dumps,
+    loads
+)
+
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+    from botocore.exceptions import ClientError
+
+# Minimum interval between stdout flushes while streaming (seconds)
+STREAM_FLUSH_INTERVAL = 0.016
+
+# Response headers carrying server-side token counts for every model
+INPUT_TOKEN_HEADER = 'x-amzn-bedrock-input-token-count'
+OUTPUT_TOKEN_HEADER = 'x-amzn-bedrock-output-token-count'
+
+class ChatResult(str):
+    """Model response text with token usage and latency metadata.
+    
+    A ``str`` subclass, so callers that print or compare the response keep
+    working. Token counts come from Bedrock and are None when unavailable
+    (e.g. for cached responses).
+    """
+    prompt_tokens: Optional[int]
+    completion_tokens: Optional[int]
+    latency_s: float
+    
+    def __new__(
+        cls,
+        text: str,
+        prompt_tokens: Optional[int] = None,
+        completion_tokens: Optional[int] = None,
+        latency_s: float = 0.0
+    ) -> 'ChatResult':
+        result = super().__new__(cls, text)
+        result.prompt_tokens = prompt_tokens
+        result.completion_tokens = completion_tokens
+        result.latency_s = latency_s
+        return result
+    
+    @property
+    def text(self) -> str:
+        """Response text as a plain string."""
+        return str.__str__(self)
+    
+    @property
+    def total_tokens(self) -> Optional[int]:
+        """Combined prompt and completion tokens, if both are known."""
+        if self.prompt_tokens is None or self.completion_tokens is None:
+            return None
+        return self.prompt_tokens + self.completion_tokens
 
 class ChatHistory:
-    """Maintains chat history for context."""
-    def __init__(self):
-        self.messages: List[Dict[str, str]] = []
+    """Maintains chat history for context.
+    
+    Only the most recent ``max_messages`` messages are kept; older ones are
+    evicted as new messages arrive.
+    """
+    def __init__(self, max_messages: int = 64):
+        self.messages: Deque[Dict[str, str]] = deque(maxlen=max_messages)
+        self._joined: Optional[Tuple[Tuple[Optional[str], int], str]] = None
         
     def add_message(self, role: str, content: str):
         """Add a message to history."""
         self.messages.append({"role": role, "content": content})
+        self._joined = None
         
     def get_context(self, max_messages: int = 10) -> List[Dict[str, str]]:
         """Get recent message context."""
-        return self.messages[-max_messages:]
+        return list(islice(self.messages, max(0, len(self.messages) - max_messages), None))
+    
+    def joined(self, system_prompt: Optional[str] = None, max_messages: int = 10) -> str:
+        """Get recent message context as a single newline-joined string.
+        
+        The result is cached until the history changes.
+        
+        Args:
+            system_prompt: Optional system instructions to prefix
+            max_messages: Number of recent messages to include
+            
+        Returns:
+            Joined message contents
+        """
+        key = (system_prompt, max_messages)
+        if self._joined is None or self._joined[0] != key:
+            contents = [msg["content"] for msg in self.get_context(max_messages)]
+            if system_prompt:
+                contents.insert(0, system_prompt)
+            self._joined = (key, "\n".join(contents))
+        return self._joined[1]
     
     def clear(self):
         """Clear chat history."""
-        self.messages = []
+        self.messages.clear()
+        self._joined = None
 
 def format_prompt(
     prompt: str,
     system_prompt: Optional[str] = None,
-    chat_history: Optional[ChatHistory] = None
+    chat_history: Optional[ChatHistory] = None,
+    flatten: bool = False
 ) -> Union[str, List[Dict[str, str]]]:
     """Format prompt based on model requirements.
     
@@ -37,17 +126,19 @@ def format_prompt(
         prompt: User prompt
         system_prompt: Optional system instructions
         chat_history: Optional chat history
+        flatten: Whether to join context into a single string for text-completion models
         
     Returns:
         Formatted prompt (string or message list)
     """
     if chat_history and chat_history.messages:
-        messages = chat_history.get_context()
-        if system_prompt:
-            messages.insert(0, {"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
-        return messages
+        if flatten:
+            return f"{chat_history.joined(system_prompt)}\n{prompt}"
+        system = [{"role": "system", "content": system_prompt}] if system_prompt else []
+        return system + chat_history.get_context() + [{"role": "user", "content": prompt}]
     elif system_prompt:
+        if flatten:
+            return f"{system_prompt}\n{prompt}"
         return [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": prompt}
@@ -55,6 +146,148 @@ def format_prompt(
     else:
         return prompt
 
+def _is_throttling(error: "ClientError") -> bool:
+    """Check whether an AWS error is a throttling error."""
+    return error.response.get("Error", {}).get("Code") == "ThrottlingException"
+
+def _build_invoke_body(
+    model_name: str,
+    prompt: str,
+    max_tokens: int,
+    temperature: float,
+    system_prompt: Optional[str] = None,
+    chat_history: Optional[ChatHistory] = None,
+    model_info: Optional[ModelInfo] = None
+) -> Tuple[ModelInfo, Dict[str, Any]]:
+    """Resolve a model and build the request body for a chat command.
+    
+    Args:
+        model_name: Short model name (e.g. 'claude-haiku')
+        prompt: User prompt
+        max_tokens: Maximum tokens to generate
+        temperature: Temperature for response generation
+        system_prompt: Optional system instructions
+        chat_history: Optional chat history for context
+        model_info: Optional pre-resolved model information for ``model_name``
+        
+    Returns:
+        Tuple of model info and request body
+        
+    Raises:
+        ValueError: If the model is unknown or unsupported
+    """
+    if model_info is None:
+        model_info = get_model_info(model_name)
+        if not model_info:
+            raise ValueError(f"Unknown model '{model_name}'")
+        
+    config = ModelConfig.from_model_info(
+        model_info,
+        max_tokens=max_tokens,
+        temperature=temperature
+    )
+    formatted_prompt = format_prompt(
+        prompt,
+        system_prompt,
+        chat_history,
+        flatten=model_info.family in TEXT_PROMPT_FAMILIES
+    )
+    return model_info, config.to_request_body(formatted_prompt)
+
+def _print_request(model_name: str, prompt: str, system_prompt: Optional[str], streaming: bool):
+    """Print the request summary shown before each call."""
+    print(f"\nModel: {model_name}")
+    print(f"Prompt: '{prompt}'")
+    if system_prompt:
+        print(f"System: '{system_prompt}'")
+    print(f"Starting {'streaming ' if streaming else ''}request...\n")
+
+def _optional_int(value: Any) -> Optional[int]:
+    """Convert a token count from a response body or header to an int."""
+    return None if value is None else int(value)
+
+def _parse_usage(
+    model_info: ModelInfo,
+    response_body: Dict[str, Any],
+    response: Dict[str, Any]
+) -> Tuple[Optional[int], Optional[int]]:
+    """Extract prompt and completion token counts from a non-streaming response.
+    
+    Usage reported in the body is preferred; the Bedrock token-count headers,
+    present for every model, are used as a fallback.
+    
+    Returns:
+        Tuple of prompt and completion token counts
+    """
+    family = model_info.family
+    if family == 'claude3':
+        usage = response_body.get('usage', {})
+        prompt_tokens, completion_tokens = usage.get('input_tokens'), usage.get('output_tokens')
+    elif family == 'titan':
+        prompt_tokens = response_body.get('inputTextTokenCount')
+        completion_tokens = response_body.get('results', [{}])[0].get('tokenCount')
+    elif family == 'llama':
+        prompt_tokens = response_body.get('prompt_token_count')
+        completion_tokens = response_body.get('generation_token_count')
+    else:
+        prompt_tokens = completion_tokens = None
+    
+    headers = response.get('ResponseMetadata', {}).get('HTTPHeaders', {})
+    if prompt_tokens is None:
+        prompt_tokens = headers.get(INPUT_TOKEN_HEADER)
+    if completion_tokens is None:
+        completion_tokens = headers.get(OUTPUT_TOKEN_HEADER)
+    return _optional_int(prompt_tokens), _optional_int(completion_tokens)
+
+def _stream_result(text: str, metrics: Dict[str, Any], start_time: float) -> ChatResult:
+    """Build a streaming result from the invocation metrics of the final chunk."""
+    return ChatResult(
+        text,
+        prompt_tokens=_optional_int(metrics.get('inputTokenCount')),
+        completion_tokens=_optional_int(metrics.get('outputTokenCount')),
+        latency_s=time.time() - start_time
+    )
+
+class _StreamOutput:
+    """Writes streamed text to stdout, flushing in time/size buckets."""
+    
+    def __init__(self, chunk_size: int):
+        self.chunk_size = chunk_size
+        self._parts: List[str] = []
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        sys.stdout.write("\nResponse: ")
+    
+    def write(self, chunk: str):
+        """Write a chunk, flushing once enough text or time has accumulated."""
+        self._parts.append(chunk)
+        sys.stdout.write(chunk)
+        self._pending += len(chunk)
+        now = time.monotonic()
+        if self._pending >= self.chunk_size or now - self._last_flush > STREAM_FLUSH_INTERVAL:
+            sys.stdout.flush()
+            self._pending = 0
+            self._last_flush = now
+    
+    def finish(self) -> str:
+        """Flush any remaining output and return the full response text."""
+        sys.stdout.flush()
+        return "".join(self._parts)
+
+def _parse_response_text(model_info: ModelInfo, response_body: Dict[str, Any]) -> str:
+    """Extract generated text from a non-streaming response body."""
+    family = model_info.family
+    if family == 'claude3':
+        return response_body.get('content', [{}])[0].get('text', '')
+    elif family == 'claude':
+        return response_body.get('completion', '')
+    elif family == 'titan':
+        return response_body.get('results', [{}])[0].get('outputText', '')
+    elif family == 'llama':
+        return response_body.get('generation', '')
+    else:
+        return response_body.get('outputs', [{}])[0].get('text', '')
+
 def chat_command(
     prompt: str,
     model_name: str,
@@ -62,8 +295,11 @@ def chat_command(
     temperature: float = 0.7,
     system_prompt: Optional[str] = None,
     chat_history: Optional[ChatHistory] = None,
-    stream: bool = False
-) -> str:
+    stream: bool = False,
+    cache: Optional[ResponseCache] = None,
+    model_info: Optional[ModelInfo] = None,
+    client: Optional["BaseClient"] = None
+) -> ChatResult:
     """Run chat command with enhanced features.
     
     Args:
@@ -74,121 +310,94 @@ def chat_command(
         system_prompt: Optional system instructions
         chat_history: Optional chat history for context
         stream: Whether to use streaming mode
+        cache: Optional response cache; bypassed when chat history provides context
+        model_info: Optional pre-resolved model information, skipping the registry lookup
+        client: Optional pre-built Bedrock runtime client to use instead of the shared one
         
     Returns:
-        Model response text
+        Model response text with token usage metadata
     """
-    try:
-        # Get model info and create config
-        model_info = get_model_info(model_name)
-        if not model_info:
-            raise ValueError(f"Unknown model '{model_name}'")
-            
-        config = ModelConfig.from_model_name(
-            model_name,
+    if stream:
+        return stream_chat_command(
+            prompt=prompt,
+            model_name=model_name,
             max_tokens=max_tokens,
-            temperature=temperature
+            temperature=temperature,
+            system_prompt=system_prompt,
+            chat_history=chat_history,
+            model_info=model_info,
+            client=client
         )
         
-        # Format prompt
-        formatted_prompt = format_prompt(prompt, system_prompt, chat_history)
-        
-        print(f"\nModel: {model_name}")
-        print(f"Prompt: '{prompt}'")
-        if system_prompt:
-            print(f"System: '{system_prompt}'")
-        print("Starting request...\n")
+    # Imported lazily so listing models and --help do not load botocore
+    from botocore.exceptions import ClientError
+    
+    try:
+        model_info, body = _build_invoke_body(
+            model_name, prompt, max_tokens, temperature, system_prompt, chat_history, model_info
+        )
+        _print_request(model_name, prompt, system_prompt, streaming=False)
         
         start_time = time.time()
         
-        # Make API call
-        client = get_bedrock_client(streaming=stream)
-        
-        if stream:
-            return stream_chat_command(
-                prompt=prompt,
-                model_name=model_name,
-                max_tokens=max_tokens,
-                temperature=temperature,
+        # Serve repeated requests from cache
+        use_cache = cache is not None and not (chat_history and chat_history.messages)
+        if use_cache:
+            cached = cache.lookup(
+                model_info.model_id,
+                prompt,
                 system_prompt=system_prompt,
-                chat_history=chat_history
+                max_tokens=max_tokens,
+                temperature=temperature
             )
-            
-        # Prepare request body based on model type
-        if model_info.model_id.startswith('anthropic.claude-3'):
-            body = {
-                "messages": formatted_prompt if isinstance(formatted_prompt, list) else [{"role": "user", "content": formatted_prompt}],
-                **config.to_request_body()
-            }
-        elif model_info.model_id.startswith('anthropic.'):
-            body = {
-                "prompt": formatted_prompt if isinstance(formatted_prompt, str) else "\n".join(msg["content"] for msg in formatted_prompt),
-                **config.to_request_body()
-            }
-        elif model_info.model_id.startswith('amazon.'):
-            # For Titan models, combine prompt with context
-            final_prompt = formatted_prompt
-            if isinstance(formatted_prompt, list):
-                final_prompt = "\n".join(msg["content"] for msg in formatted_prompt)
-            
-            body = config.to_request_body()
-            body["inputText"] = final_prompt
-        elif model_info.model_id.startswith('meta.'):
-            # For Llama models, add system prompt and format
-            if system_prompt:
-                prompt = f"[INST] {system_prompt}\n\n{prompt} [/INST]"
-            else:
-                prompt = f"[INST] {prompt} [/INST]"
-                
-            body = {
-                "prompt": prompt,
-                **config.to_request_body()
-            }
-        else:
-            # For other models, concatenate context if available
-            final_prompt = formatted_prompt
-            if isinstance(formatted_prompt, list):
-                final_prompt = "\n".join(msg["content"] for msg in formatted_prompt)
-            
-            body = {
-                "prompt": final_prompt,
-                **config.to_request_body()
-            }
-            
+            if cached is not None:
+                if chat_history is not None:
+                    chat_history.add_message("assistant", cached)
+                print(f"Response (cached): {cached}")
+                latency = time.time() - start_time
+                print(f"\nRequest completed in {latency:.2f} seconds")
+                return ChatResult(cached, latency_s=latency)
+        
+        # Make API call
+        client = get_bedrock_client(client=client)
         response = client.invoke_model(
             modelId=model_info.model_id,
-            body=json.dumps(body)
+            body=dumps(body)
         )
         
         # Parse response
-        response_body = json.loads(response.get('body').read())
-        response_text = ""
-        
-        if model_info.model_id.startswith('anthropic.claude-3'):
-            response_text = response_body.get('content', [{}])[0].get('text', '')
-        elif model_info.model_id.startswith('anthropic.'):
-            response_text = response_body.get('completion', '')
-        elif model_info.model_id.startswith('amazon.'):
-            response_text = response_body.get('results', [{}])[0].get('outputText', '')
-        elif model_info.model_id.startswith('meta.'):
-            response_text = response_body.get('generation', '')
-        else:
-            response_text = response_body.get('outputs', [{}])[0].get('text', '')
+        response_body = loads(response['body'].read())
+        response_text = _parse_response_text(model_info, response_body)
+        prompt_tokens, completion_tokens = _parse_usage(model_info, response_body, response)
+            
+        if use_cache:
+            cache.store(
+                model_info.model_id,
+                prompt,
+                response_text,
+                system_prompt=system_prompt,
+                max_tokens=max_tokens,
+                temperature=temperature
+            )
             
         # Update chat history if available
         if chat_history is not None:
             chat_history.add_message("assistant", response_text)
             
         print(f"Response: {response_text}")
-        print(f"\nRequest completed in {time.time() - start_time:.2f} seconds")
+        latency = time.time() - start_time
+        print(f"\nRequest completed in {latency:.2f} seconds")
         
-        return response_text
+        return ChatResult(response_text, prompt_tokens, completion_tokens, latency)
             
     except ClientError as e:
         error_msg = f"\n❌ AWS API error: {str(e)}"
         print(error_msg)
         raise RuntimeError(error_msg)
     except Exception as e:
+        if is_stale_connection_error(e):
+            # Drop the cached client so the next request gets fresh connections
+            invalidate_runtime_client()
         error_msg = f"\n❌ Error: {str(e)}"
         print(error_msg)
         raise
@@ -200,8 +409,10 @@ def stream_chat_command(
     temperature: float = 0.7,
     system_prompt: Optional[str] = None,
     chat_history: Optional[ChatHistory] = None,
-    print_fn: Optional[callable] = print
-) -> str:
+    print_fn: Optional[callable] = print,
+    model_info: Optional[ModelInfo] = None,
+    client: Optional["BaseClient"] = None
+) -> ChatResult:
     """Run streaming chat command with enhanced features.
     
     Args:
@@ -212,106 +423,216 @@ def stream_chat_command(
         system_prompt: Optional system instructions
         chat_history: Optional chat history
         print_fn: Optional function to print status messages
+        model_info: Optional pre-resolved model information, skipping the registry lookup
+        client: Optional pre-built Bedrock runtime client to use instead of the shared one
         
     Returns:
-        Complete response text
+        Complete response text with token usage metadata
     """
+    # Imported lazily so listing models and --help do not load botocore
+    from botocore.exceptions import ClientError
+    
     try:
-        # Get model info and create configs
-        model_info = get_model_info(model_name)
-        if not model_info:
-            raise ValueError(f"Unknown model '{model_name}'")
-            
-        model_config = ModelConfig.from_model_name(
-            model_name,
-            max_tokens=max_tokens,
-            temperature=temperature
+        model_info, body = _build_invoke_body(
+            model_name, prompt, max_tokens, temperature, system_prompt, chat_history, model_info
         )
         stream_config = StreamConfig()
-        
-        # Format prompt
-        formatted_prompt = format_prompt(prompt, system_prompt, chat_history)
-        
-        print(f"\nModel: {model_name}")
-        print(f"Prompt: '{prompt}'")
-        if system_prompt:
-            print(f"System: '{system_prompt}'")
-        print("Starting streaming request...\n")
+        extractor = EXTRACTORS[model_info.family]
+        _print_request(model_name, prompt, system_prompt, streaming=True)
         
         start_time = time.time()
         
-        # Prepare request body based on model type
-        if model_info.model_id.startswith('anthropic.claude-3'):
-            body = {
-                "messages": formatted_prompt if isinstance(formatted_prompt, list) else [{"role": "user", "content": formatted_prompt}],
-                **model_config.to_request_body()
-            }
-        elif model_info.model_id.startswith('anthropic.'):
-            body = {
-                "prompt": formatted_prompt if isinstance(formatted_prompt, str) else "\n".join(msg["content"] for msg in formatted_prompt),
-                **model_config.to_request_body()
-            }
-        elif model_info.model_id.startswith('amazon.'):
-            # For Titan models, combine prompt with context
-            final_prompt = formatted_prompt
-            if isinstance(formatted_prompt, list):
-                final_prompt = "\n".join(msg["content"] for msg in formatted_prompt)
-            
-            body = model_config.to_request_body()
-            body["inputText"] = final_prompt
-        elif model_info.model_id.startswith('meta.'):
-            # For Llama models, add system prompt and format
-            if system_prompt:
-                prompt = f"[INST] {system_prompt}\n\n{prompt} [/INST]"
-            else:
-                prompt = f"[INST] {prompt} [/INST]"
-                
-            body = {
-                "prompt": prompt,
-                **model_config.to_request_body()
-            }
-        else:
-            # For other models (Mistral), concatenate context
-            final_prompt = formatted_prompt
-            if isinstance(formatted_prompt, list):
-                final_prompt = "\n".join(msg["content"] for msg in formatted_prompt)
-            
-            body = {
-                "prompt": final_prompt,
-                **model_config.to_request_body()
-            }
-        
         # Make API call with retries
-        client = get_bedrock_client(streaming=True)
-        complete_response = ""
+        client = get_bedrock_client(streaming=True, client=client)
+        serialized_body = dumps(body)
+        delay = None
         
         for attempt in range(stream_config.retry_attempts):
             try:
                 response = client.invoke_model_with_response_stream(
                     modelId=model_info.model_id,
-                    body=json.dumps(body)
+                    body=serialized_body
                 )
                 
-                # Process stream
-                print("\nResponse: ", end="")
-                for chunk in process_stream_chunks(response, stream_config, print_fn):
-                    print(chunk, end="", flush=True)
-                    complete_response += chunk
+                # Process stream, flushing output in time/size buckets
+                output = _StreamOutput(stream_config.chunk_size)
+                metrics: Dict[str, Any] = {}
+                for chunk in process_stream_chunks(
+                    response,
+                    stream_config,
+                    print_fn,
+                    on_metrics=metrics.update,
+                    extractor=extractor
+                ):
+                    output.write(chunk)
+                result = _stream_result(output.finish(), metrics, start_time)
                     
-                print(f"\n\nRequest completed in {time.time() - start_time:.2f} seconds")
+                print(f"\n\nRequest completed in {result.latency_s:.2f} seconds")
                 
                 # Update chat history if available
                 if chat_history is not None:
-                    chat_history.add_message("assistant", complete_response)
+                    chat_history.add_message("assistant", result.text)
                 
-                return complete_response
+                return result
                 
             except ClientError as e:
-                if "ThrottlingException" in str(e) and attempt < stream_config.retry_attempts - 1:
-                    handle_rate_limit(attempt + 1, stream_config, print_fn)
+                if _is_throttling(e) and attempt < stream_config.retry_attempts - 1:
+                    delay = handle_rate_limit(attempt + 1, stream_config, print_fn, delay)
                     continue
                 raise
                 
+    except ClientError as e:
+        error_msg = f"\n❌ AWS API error: {str(e)}"
+        print(error_msg)
+        raise RuntimeError(error_msg)
+    except Exception as e:
+        if is_stale_connection_error(e):
+            # Drop the cached client so the next request gets fresh connections
+            invalidate_runtime_client()
+        error_msg = f"\n❌ Error: {str(e)}"
+        print(error_msg)
+        raise
+
+async def achat_command(
+    prompt: str,
+    model_name: str,
+    max_tokens: int = 100,
+    temperature: float = 0.7,
+    system_prompt: Optional[str] = None,
+    chat_history: Optional[ChatHistory] = None,
+    model_info: Optional[ModelInfo] = None
+) -> ChatResult:
+    """Run chat command asynchronously using an aioboto3 client.
+    
+    Args:
+        prompt: User prompt
+        model_name: Short model name (e.g. 'claude-haiku')
+        max_tokens: Maximum tokens to generate
+        temperature: Temperature for response generation
+        system_prompt: Optional system instructions
+        chat_history: Optional chat history for context
+        model_info: Optional pre-resolved model information, skipping the registry lookup
+        
+    Returns:
+        Model response text with token usage metadata
+    """
+    # Imported lazily so listing models and --help do not load botocore
+    from botocore.exceptions import ClientError
+    
+    try:
+        model_info, body = _build_invoke_body(
+            model_name, prompt, max_tokens, temperature, system_prompt, chat_history, model_info
+        )
+        _print_request(model_name, prompt, system_prompt, streaming=False)
+        
+        start_time = time.time()
+        
+        # Make API call
+        async with get_async_bedrock_client() as client:
+            response = await client.invoke_model(
+                modelId=model_info.model_id,
+                body=dumps(body)
+            )
+            response_body = loads(await response['body'].read())
+            
+        response_text = _parse_response_text(model_info, response_body)
+        prompt_tokens, completion_tokens = _parse_usage(model_info, response_body, response)
+        
+        # Update chat history if available
+        if chat_history is not None:
+            chat_history.add_message("assistant", response_text)
+            
+        print(f"Response: {response_text}")
+        latency = time.time() - start_time
+        print(f"\nRequest completed in {latency:.2f} seconds")
+        
+        return ChatResult(response_text, prompt_tokens, completion_tokens, latency)
+            
+    except ClientError as e:
+        error_msg = f"\n❌ AWS API error: {str(e)}"
+        print(error_msg)
+        raise RuntimeError(error_msg)
+    except Exception as e:
+        error_msg = f"\n❌ Error: {str(e)}"
+        print(error_msg)
+        raise
+
+async def astream_chat_command(
+    prompt: str,
+    model_name: str,
+    max_tokens: int = 100,
+    temperature: float = 0.7,
+    system_prompt: Optional[str] = None,
+    chat_history: Optional[ChatHistory] = None,
+    print_fn: Optional[callable] = print,
+    model_info: Optional[ModelInfo] = None
+) -> ChatResult:
+    """Run streaming chat command asynchronously using an aioboto3 client.
+    
+    Args:
+        prompt: User prompt
+        model_name: Short model name (e.g. 'claude-haiku')
+        max_tokens: Maximum tokens to generate
+        temperature: Temperature for response generation
+        system_prompt: Optional system instructions
+        chat_history: Optional chat history
+        print_fn: Optional function to print status messages
+        model_info: Optional pre-resolved model information, skipping the registry lookup
+        
+    Returns:
+        Complete response text with token usage metadata
+    """
+    # Imported lazily so listing models and --help do not load botocore
+    from botocore.exceptions import ClientError
+    
+    try:
+        model_info, body = _build_invoke_body(
+            model_name, prompt, max_tokens, temperature, system_prompt, chat_history, model_info
+        )
+        stream_config = StreamConfig()
+        extractor = EXTRACTORS[model_info.family]
+        _print_request(model_name, prompt, system_prompt, streaming=True)
+        
+        start_time = time.time()
+        
+        # Make API call with retries
+        serialized_body = dumps(body)
+        delay = None
+        async with get_async_bedrock_client(streaming=True) as client:
+            for attempt in range(stream_config.retry_attempts):
+                try:
+                    response = await client.invoke_model_with_response_stream(
+                        modelId=model_info.model_id,
+                        body=serialized_body
+                    )
+                    
+                    # Process stream, flushing output in time/size buckets
+                    output = _StreamOutput(stream_config.chunk_size)
+                    metrics: Dict[str, Any] = {}
+                    async for chunk in process_stream_chunks_async(
+                        response,
+                        stream_config,
+                        print_fn,
+                        on_metrics=metrics.update,
+                        extractor=extractor
+                    ):
+                        output.write(chunk)
+                    result = _stream_result(output.finish(), metrics, start_time)
+                        
+                    print(f"\n\nRequest completed in {result.latency_s:.2f} seconds")
+                    
+                    # Update chat history if available
+                    if chat_history is not None:
+                        chat_history.add_message("assistant", result.text)
+                    
+                    return result
+                    
+                except ClientError as e:
+                    if _is_throttling(e) and attempt < stream_config.retry_attempts - 1:
+                        delay = await handle_rate_limit_async(attempt + 1, stream_config, print_fn, delay)
+                        continue
+                    raise
+                
     except ClientError as e:
         error_msg = f"\n❌ AWS API error: {str(e)}"
         print(error_msg)
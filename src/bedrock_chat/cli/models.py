@@ -1,41 +1,20 @@
 """Model listing command for AWS Bedrock Chat CLI."""
 
-from ..models import get_available_models
+from ..models import get_models_by_family
 
 def list_models_command() -> None:
     """List all available models with their IDs."""
-    models = get_available_models()
-    
     print("\nAvailable Models:")
     print("================\n")
     
-    # Claude Models
-    print("Claude Models:")
-    print("-------------")
-    for name, id in models.items():
-        if name.startswith('claude-'):
-            print(f"- {name}: {id}")
-    
-    # Titan Models
-    print("\nTitan Models:")
-    print("------------")
-    for name, id in models.items():
-        if name.startswith('titan-'):
-            print(f"- {name}: {id}")
-    
-    # Llama Models
-    print("\nLlama Models:")
-    print("------------")
-    for name, id in models.items():
-        if name.startswith('llama-'):
-            print(f"- {name}: {id}")
-    
-    # Mistral Models
-    print("\nMistral Models:")
-    print("--------------")
-    for name, id in models.items():
-        if name.startswith('mistral-'):
-            print(f"- {name}: {id}")
+    for index, (family, entries) in enumerate(get_models_by_family().items()):
+        if index:
+            print()
+        heading = f"{family.title()} Models:"
+        print(heading)
+        print("-" * (len(heading) - 1))
+        for name, model_id in entries:
+            print(f"- {name}: {model_id}")
     
     print("\nUsage Examples:")
     print("--------------")
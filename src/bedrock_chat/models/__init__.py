@@ -1,13 +1,24 @@
 """Model configuration and registry for AWS Bedrock Chat."""
 
 from .model_config import ModelConfig, StreamConfig
-from .model_registry import get_model_id, get_model_info, get_available_models, ModelInfo
+from .model_registry import (
+    get_model_id,
+    get_model_info,
+    get_model_family,
+    get_available_models,
+    get_models_by_family,
+    is_known_model_id,
+    ModelInfo
+)
 
 __all__ = [
     'ModelConfig',
     'StreamConfig',
     'get_model_id',
     'get_model_info',
+    'get_model_family',
     'get_available_models',
+    'get_models_by_family',
+    'is_known_model_id',
     'ModelInfo'
 ]
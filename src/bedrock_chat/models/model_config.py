@@ -1,10 +1,13 @@
 """Model configuration classes for AWS Bedrock Chat."""
 
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
-from .model_registry import get_model_info, ModelInfo
+from typing import Optional, Dict, Any, Callable, List, Tuple, Union
+from .model_registry import get_model_info, get_model_family, ModelInfo
 
-@dataclass
+# Prompt as a plain string or a list of chat messages
+Prompt = Union[str, List[Dict[str, str]]]
+
+@dataclass(slots=True, frozen=True)
 class ModelConfig:
     """Configuration for a Bedrock model."""
     model_id: str
@@ -12,21 +15,43 @@ class ModelConfig:
     max_tokens: int = 100
     top_p: float = 1.0
     top_k: int = 250
-    stop_sequences: Optional[list[str]] = None
+    stop_sequences: Optional[Tuple[str, ...]] = None
     api_version: Optional[str] = None
     model_info: Optional[ModelInfo] = None
     
     def __post_init__(self):
         """Validate configuration parameters."""
-        if not 0 <= self.temperature <= 1:
+        self.validate(
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            top_p=self.top_p,
+            top_k=self.top_k
+        )
+        if self.stop_sequences is not None:
+            object.__setattr__(self, 'stop_sequences', tuple(self.stop_sequences))
+    
+    @classmethod
+    def validate(
+        cls,
+        temperature: float = 0.7,
+        max_tokens: int = 100,
+        top_p: float = 1.0,
+        top_k: int = 250
+    ) -> None:
+        """Validate configuration parameters.
+        
+        Raises:
+            ValueError: If any parameter is out of range
+        """
+        if not 0 <= temperature <= 1:
             raise ValueError("Temperature must be between 0 and 1")
-        if not 0 <= self.top_p <= 1:
+        if not 0 <= top_p <= 1:
             raise ValueError("Top-p must be between 0 and 1")
-        if self.top_k < 0:
+        if top_k < 0:
             raise ValueError("Top-k must be non-negative")
-        if self.max_tokens < 1:
+        if max_tokens < 1:
             raise ValueError("Max tokens must be positive")
-        
+    
     @classmethod
     def from_model_name(cls, model_name: str, **kwargs) -> 'ModelConfig':
         """Create config from model name.
@@ -44,7 +69,22 @@ class ModelConfig:
         model_info = get_model_info(model_name)
         if not model_info:
             raise ValueError(f"Unknown model: {model_name}")
+        return cls.from_model_info(model_info, **kwargs)
+    
+    @classmethod
+    def from_model_info(cls, model_info: ModelInfo, **kwargs) -> 'ModelConfig':
+        """Create config from already-resolved model information.
+        
+        Args:
+            model_info: Model information from the registry
+            **kwargs: Additional config parameters
             
+        Returns:
+            ModelConfig instance
+            
+        Raises:
+            ValueError: If parameters are invalid
+        """
         # Ensure max_tokens doesn't exceed model's context window
         max_tokens = kwargs.get('max_tokens', 100)
         if max_tokens > model_info.context_window:
@@ -60,59 +100,126 @@ class ModelConfig:
             **kwargs
         )
     
-    def to_request_body(self) -> Dict[str, Any]:
+    def to_request_body(self, prompt: Optional[Prompt] = None) -> Dict[str, Any]:
         """Convert config to request body based on model type.
         
+        Args:
+            prompt: Optional prompt (string or message list) to include in the body
+            
         Returns:
             Dictionary containing model-specific request parameters
             
         Raises:
             ValueError: If model type is unsupported
         """
-        if self.model_id.startswith('anthropic.claude-3'):
-            return {
-                "anthropic_version": self.api_version or "bedrock-2023-05-31",
-                "max_tokens": self.max_tokens,
-                "temperature": self.temperature,
-                "top_k": self.top_k,
-                "top_p": self.top_p,
-                "stop_sequences": self.stop_sequences or []
-            }
-        elif self.model_id.startswith('anthropic.'):
-            return {
-                "max_tokens": self.max_tokens,
-                "temperature": self.temperature,
-                "top_k": self.top_k,
-                "top_p": self.top_p,
-                "stop_sequences": self.stop_sequences or []
-            }
-        elif self.model_id.startswith('amazon.'):
-            return {
-                "inputText": "",  # Will be set in chat command
-                "textGenerationConfig": {
-                    "maxTokenCount": self.max_tokens,
-                    "temperature": self.temperature,
-                    "topP": self.top_p,
-                    "stopSequences": self.stop_sequences or []
-                }
-            }
-        elif self.model_id.startswith('meta.'):
-            return {
-                "max_gen_len": self.max_tokens,
-                "temperature": self.temperature,
-                "top_p": self.top_p
-            }
-        elif self.model_id.startswith('mistral.'):
-            return {
-                "max_tokens": self.max_tokens,
-                "temperature": self.temperature,
-                "top_p": self.top_p,
-                "stop": self.stop_sequences or []
-            }
-        else:
+        family = self.model_info.family if self.model_info else get_model_family(self.model_id)
+        if family not in BODY_BUILDERS:
             raise ValueError(f"Unsupported model: {self.model_id}")
+        
+        body = BODY_BUILDERS[family](self)
+        if prompt is not None:
+            PROMPT_SETTERS[family](body, prompt)
+        return body
+
+def _prompt_text(prompt: Prompt) -> str:
+    """Flatten a message list into a single prompt string."""
+    if isinstance(prompt, str):
+        return prompt
+    return "\n".join(msg["content"] for msg in prompt)
+
+def _claude3_body(config: ModelConfig) -> Dict[str, Any]:
+    """Build Claude 3 messages API request parameters."""
+    return {
+        "anthropic_version": config.api_version or "bedrock-2023-05-31",
+        "max_tokens": config.max_tokens,
+        "temperature": config.temperature,
+        "top_k": config.top_k,
+        "top_p": config.top_p,
+        "stop_sequences": list(config.stop_sequences or ())
+    }
+
+def _claude3_prompt(body: Dict[str, Any], prompt: Prompt):
+    """Set the messages of a Claude 3 request."""
+    body["messages"] = prompt if isinstance(prompt, list) else [{"role": "user", "content": prompt}]
+
+def _claude_body(config: ModelConfig) -> Dict[str, Any]:
+    """Build Claude text completion request parameters."""
+    return {
+        "max_tokens": config.max_tokens,
+        "temperature": config.temperature,
+        "top_k": config.top_k,
+        "top_p": config.top_p,
+        "stop_sequences": list(config.stop_sequences or ())
+    }
+
+def _titan_body(config: ModelConfig) -> Dict[str, Any]:
+    """Build Titan text request parameters."""
+    return {
+        "inputText": "",
+        "textGenerationConfig": {
+            "maxTokenCount": config.max_tokens,
+            "temperature": config.temperature,
+            "topP": config.top_p,
+            "stopSequences": list(config.stop_sequences or ())
+        }
+    }
+
+def _titan_prompt(body: Dict[str, Any], prompt: Prompt):
+    """Set the input text of a Titan request."""
+    body["inputText"] = _prompt_text(prompt)
+
+def _llama_body(config: ModelConfig) -> Dict[str, Any]:
+    """Build Llama request parameters."""
+    return {
+        "max_gen_len": config.max_tokens,
+        "temperature": config.temperature,
+        "top_p": config.top_p
+    }
+
+def _llama_prompt(body: Dict[str, Any], prompt: Prompt):
+    """Set the prompt of a Llama request, wrapped in instruction tags."""
+    if isinstance(prompt, str):
+        body["prompt"] = f"[INST] {prompt} [/INST]"
+    elif prompt[0]["role"] == "system":
+        body["prompt"] = f"[INST] {prompt[0]['content']}\n\n{prompt[-1]['content']} [/INST]"
+    else:
+        body["prompt"] = f"[INST] {prompt[-1]['content']} [/INST]"
+
+def _mistral_body(config: ModelConfig) -> Dict[str, Any]:
+    """Build Mistral request parameters."""
+    return {
+        "max_tokens": config.max_tokens,
+        "temperature": config.temperature,
+        "top_p": config.top_p,
+        "stop": list(config.stop_sequences or ())
+    }
+
+def _text_prompt(body: Dict[str, Any], prompt: Prompt):
+    """Set the prompt of a text completion request."""
+    body["prompt"] = _prompt_text(prompt)
+
+# Request parameter builders keyed by model family
+BODY_BUILDERS: Dict[str, Callable[[ModelConfig], Dict[str, Any]]] = {
+    'claude3': _claude3_body,
+    'claude': _claude_body,
+    'titan': _titan_body,
+    'llama': _llama_body,
+    'mistral': _mistral_body
+}
+
+# Prompt setters keyed by model family
+PROMPT_SETTERS: Dict[str, Callable[[Dict[str, Any], Prompt], None]] = {
+    'claude3': _claude3_prompt,
+    'claude': _text_prompt,
+    'titan': _titan_prompt,
+    'llama': _llama_prompt,
+    'mistral': _text_prompt
+}
+
+# Families whose request bodies take the prompt as a single string
+TEXT_PROMPT_FAMILIES = frozenset(('claude', 'titan', 'mistral'))
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StreamConfig:
     """Configuration for streaming responses."""
     chunk_size: int = 1024
@@ -1,24 +1,72 @@
 """Model registry for AWS Bedrock Chat."""
 
-from typing import Dict, Optional, Tuple, NamedTuple
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
 
-class ModelInfo(NamedTuple):
+@dataclass(slots=True, frozen=True)
+class ModelInfo:
     """Model information container."""
     model_id: str
     api_version: Optional[str]
     context_window: int
     supports_streaming: bool
+    family: str
 
-# Map short names to model information
-MODEL_REGISTRY: Dict[str, ModelInfo] = {
+# Request format family for each model provider prefix
+PROVIDER_FAMILIES: Dict[str, str] = {
+    'anthropic': 'claude',
+    'amazon': 'titan',
+    'meta': 'llama',
+    'mistral': 'mistral'
+}
+
+# Listing group for each family; both Claude generations are grouped together
+FAMILY_GROUPS: Dict[str, str] = {
+    'claude3': 'claude',
+    'claude': 'claude',
+    'titan': 'titan',
+    'llama': 'llama',
+    'mistral': 'mistral'
+}
+
+def get_model_family(model_id: str) -> Optional[str]:
+    """Get the request format family for a full model ID.
+    
+    Args:
+        model_id: Full model ID (e.g. 'anthropic.claude-3-haiku-20240307-v1:0')
+        
+    Returns:
+        Family tag ('claude3', 'claude', 'titan', 'llama' or 'mistral') if known, None otherwise
+    """
+    # Claude 3 is the only family that needs more than the provider prefix
+    if model_id.startswith('anthropic.claude-3'):
+        return 'claude3'
+    provider, separator, _ = model_id.partition('.')
+    return PROVIDER_FAMILIES.get(provider) if separator else None
+
+def _model_info(
+    model_id: str,
+    api_version: Optional[str],
+    context_window: int,
+    supports_streaming: bool
+) -> ModelInfo:
+    """Create model information, classifying the model family once."""
+    family = get_model_family(model_id)
+    if family is None:
+        raise ValueError(f"Unsupported model: {model_id}")
+    return ModelInfo(model_id, api_version, context_window, supports_streaming, family)
+
+# Map short names to model information (read-only; built once at import)
+MODEL_REGISTRY: Mapping[str, ModelInfo] = MappingProxyType({
     # Claude Models
-    'claude-sonnet': ModelInfo(
+    'claude-sonnet': _model_info(
         'anthropic.claude-3-sonnet-20240229-v1:0',
         'bedrock-2023-05-31',
         200000,
         True
     ),
-    'claude-haiku': ModelInfo(
+    'claude-haiku': _model_info(
         'anthropic.claude-3-haiku-20240307-v1:0',
         'bedrock-2023-05-31',
         200000,
@@ -26,13 +74,13 @@ MODEL_REGISTRY: Dict[str, ModelInfo] = {
     ),
     
     # Titan Models
-    'titan-express': ModelInfo(
+    'titan-express': _model_info(
         'amazon.titan-text-express-v1',
         None,
         8000,
         True
     ),
-    'titan-lite': ModelInfo(
+    'titan-lite': _model_info(
         'amazon.titan-text-lite-v1',
         None,
         4000,
@@ -40,13 +88,13 @@ MODEL_REGISTRY: Dict[str, ModelInfo] = {
     ),
     
     # Llama Models
-    'llama-70b': ModelInfo(
+    'llama-70b': _model_info(
         'meta.llama3-70b-instruct-v1:0',
         None,
         32000,
         True
     ),
-    'llama-8b': ModelInfo(
+    'llama-8b': _model_info(
         'meta.llama3-8b-instruct-v1:0',
         None,
         16000,
@@ -54,25 +102,43 @@ MODEL_REGISTRY: Dict[str, ModelInfo] = {
     ),
     
     # Mistral Models
-    'mistral-7b': ModelInfo(
+    'mistral-7b': _model_info(
         'mistral.mistral-7b-instruct-v0:2',
         None,
         8000,
         True
     ),
-    'mistral-large': ModelInfo(
+    'mistral-large': _model_info(
         'mistral.mistral-large-2402-v1:0',
         None,
         32000,
         True
     ),
-    'mistral-8x7b': ModelInfo(
+    'mistral-8x7b': _model_info(
         'mistral.mixtral-8x7b-instruct-v0:1',
         None,
         32000,
         True
     )
-}
+})
+
+# Registry columns as parallel tuples, so scans iterate plain tuples
+_NAMES: Tuple[str, ...] = tuple(MODEL_REGISTRY)
+_IDS: Tuple[str, ...] = tuple(info.model_id for info in MODEL_REGISTRY.values())
+_FAMILIES: Tuple[str, ...] = tuple(info.family for info in MODEL_REGISTRY.values())
+
+# Lookup structures derived from the registry, computed once at import
+_MODEL_IDS_BY_NAME: Mapping[str, str] = MappingProxyType(dict(zip(_NAMES, _IDS)))
+_MODEL_IDS: FrozenSet[str] = frozenset(_IDS)
+
+def _group_by_family() -> Mapping[str, Tuple[Tuple[str, str], ...]]:
+    """Group registered models by listing group, in registry order."""
+    groups: Dict[str, List[Tuple[str, str]]] = {}
+    for name, model_id, family in zip(_NAMES, _IDS, _FAMILIES):
+        groups.setdefault(FAMILY_GROUPS[family], []).append((name, model_id))
+    return MappingProxyType({group: tuple(models) for group, models in groups.items()})
+
+_MODELS_BY_FAMILY = _group_by_family()
 
 def get_model_info(model_name: str) -> Optional[ModelInfo]:
     """Get model information from short name.
@@ -94,13 +160,32 @@ def get_model_id(model_name: str) -> Optional[str]:
     Returns:
         Full model ID if found, None otherwise
     """
-    model_info = get_model_info(model_name)
-    return model_info.model_id if model_info else None
+    return _MODEL_IDS_BY_NAME.get(model_name)
+
+def is_known_model_id(model_id: str) -> bool:
+    """Check whether a full model ID belongs to a registered model.
+    
+    Args:
+        model_id: Full model ID (e.g. 'anthropic.claude-3-haiku-20240307-v1:0')
+        
+    Returns:
+        True if the model ID is registered, False otherwise
+    """
+    return model_id in _MODEL_IDS
+
+def get_models_by_family() -> Mapping[str, Tuple[Tuple[str, str], ...]]:
+    """Get available models grouped by family.
+    
+    Returns:
+        Read-only mapping of family group ('claude', 'titan', 'llama' or 'mistral')
+        to (short name, full model ID) pairs
+    """
+    return _MODELS_BY_FAMILY
 
-def get_available_models() -> Dict[str, str]:
+def get_available_models() -> Mapping[str, str]:
     """Get all available models with their IDs.
     
     Returns:
-        Dictionary mapping short names to full model IDs
+        Read-only mapping of short names to full model IDs
     """
-    return {name: info.model_id for name, info in MODEL_REGISTRY.items()}
+    return _MODEL_IDS_BY_NAME
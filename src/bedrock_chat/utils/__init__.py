@@ -1,12 +1,32 @@
 """Utilities for AWS Bedrock Chat."""
 
-from .client import get_bedrock_client
-from .retry import calculate_backoff_delay, handle_rate_limit
-from .streaming import process_stream_chunks
+from .client import (
+    get_bedrock_client,
+    get_async_bedrock_client,
+    invalidate_runtime_client,
+    is_stale_connection_error
+)
+from .retry import (
+    calculate_backoff_delay,
+    decorrelated_jitter_delay,
+    handle_rate_limit,
+    handle_rate_limit_async
+)
+from .serialization import dumps, loads
+from .streaming import EXTRACTORS, process_stream_chunks, process_stream_chunks_async
 
 __all__ = [
     'get_bedrock_client',
+    'get_async_bedrock_client',
+    'invalidate_runtime_client',
+    'is_stale_connection_error',
     'calculate_backoff_delay',
+    'decorrelated_jitter_delay',
     'handle_rate_limit',
-    'process_stream_chunks'
+    'handle_rate_limit_async',
+    'dumps',
+    'loads',
+    'EXTRACTORS',
+    'process_stream_chunks',
+    'process_stream_chunks_async'
 ]
@@ -1,39 +1,197 @@
 """AWS Bedrock client utilities."""
 
+import functools
 import os
-import boto3
-from typing import Optional, Union
-from botocore.client import BaseClient
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type, Union
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+    from botocore.config import Config
+
+# Shared connection pool and retry settings for runtime clients
+CLIENT_CONFIG_OPTIONS: Dict[str, Any] = dict(
+    max_pool_connections=64,
+    retries={"mode": "adaptive", "max_attempts": 5},
+    tcp_keepalive=True,
+    read_timeout=300,
+    connect_timeout=10
+)
+
+# Streaming commands retry throttling themselves with decorrelated jitter, so
+# their clients make a single attempt instead of stacking botocore retries
+STREAMING_RETRIES: Dict[str, Any] = {"mode": "standard", "total_max_attempts": 1}
+
+# Bumped per region by invalidate_runtime_client so new calls miss stale clients
+_CLIENT_GENERATIONS: Dict[Optional[str], int] = {}
+
+# Read .env once at import rather than on every client lookup
+load_dotenv()
+
+@functools.lru_cache(maxsize=1)
+def _client_configs() -> Tuple["Config", "Config"]:
+    """Build the default and streaming client configurations once.
+    
+    botocore is imported here rather than at module import so that commands
+    which never talk to AWS do not pay its import cost.
+    """
+    from botocore.config import Config
+    return (
+        Config(**CLIENT_CONFIG_OPTIONS),
+        Config(**{**CLIENT_CONFIG_OPTIONS, "retries": STREAMING_RETRIES})
+    )
+
+def get_client_config(streaming: bool = False) -> "Config":
+    """Get the shared botocore client configuration.
+    
+    Args:
+        streaming: Whether the client is used by the streaming commands, whose
+            own retry loop replaces botocore's retries
+    """
+    return _client_configs()[streaming]
+
+@functools.lru_cache(maxsize=8)
+def _build_client(
+    aws_access_key_id: Optional[str],
+    aws_secret_access_key: Optional[str],
+    region_name: Optional[str],
+    streaming: bool,
+    generation: int = 0
+) -> "BaseClient":
+    """Build a Bedrock runtime client for fully resolved settings.
+    
+    Cached so repeated calls reuse the same client and its connection pool;
+    ``generation`` only exists to let invalidated clients fall out of the cache.
+    """
+    import boto3
+    
+    return boto3.client(
+        service_name='bedrock-runtime',
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+        region_name=region_name,
+        config=get_client_config(streaming)
+    )
+
 def get_bedrock_client(
     aws_access_key_id: Optional[str] = None,
     aws_secret_access_key: Optional[str] = None,
     region_name: Optional[str] = None,
-    streaming: bool = False
-) -> BaseClient:
+    streaming: bool = False,
+    client: Optional["BaseClient"] = None
+) -> "BaseClient":
     """Get AWS Bedrock client.
     
+    Clients are cached per resolved credential and region combination, so
+    repeated calls reuse the same client and its connection pool. boto3
+    clients are thread-safe for invocation and may be shared across
+    ``ThreadPoolExecutor`` workers.
+    
     Args:
         aws_access_key_id: Optional AWS access key ID
         aws_secret_access_key: Optional AWS secret access key
         region_name: Optional AWS region name
-        streaming: Whether to return a streaming-capable runtime client
-        
+        streaming: Whether the client is for the streaming commands, which
+            handle throttling retries themselves
+        client: Optional pre-built client, returned as-is without touching the cache
+    
     Returns:
         Configured boto3 Bedrock client
-        
+    
     Note:
         If credentials are not provided, they will be loaded from environment variables
         or AWS configuration files.
     """
-    load_dotenv()
+    if client is not None:
+        return client
     
-    service_name = 'bedrock-runtime'
+    # Resolve defaults first so explicit and implicit settings share a cache entry
+    region_name = region_name or os.getenv('AWS_REGION')
+    return _build_client(
+        aws_access_key_id or os.getenv('AWS_ACCESS_KEY_ID'),
+        aws_secret_access_key or os.getenv('AWS_SECRET_ACCESS_KEY'),
+        region_name,
+        streaming,
+        _CLIENT_GENERATIONS.get(region_name, 0)
+    )
+
+def invalidate_runtime_client(region_name: Optional[str] = None):
+    """Discard cached clients for a region after a stale-connection error.
     
-    return boto3.client(
-        service_name=service_name,
+    The next ``get_bedrock_client`` call for the region builds a fresh client
+    with a new connection pool instead of reusing a poisoned one.
+    
+    Args:
+        region_name: Optional AWS region name; defaults to ``AWS_REGION``
+    """
+    region_name = region_name or os.getenv('AWS_REGION')
+    _CLIENT_GENERATIONS[region_name] = _CLIENT_GENERATIONS.get(region_name, 0) + 1
+
+@functools.lru_cache(maxsize=1)
+def _stale_connection_errors() -> Tuple[Type[Exception], ...]:
+    """Get the exception types that indicate a broken connection pool."""
+    from botocore.exceptions import ConnectionClosedError, EndpointConnectionError, ReadTimeoutError
+    from urllib3.exceptions import ProtocolError
+    return (ConnectionClosedError, EndpointConnectionError, ReadTimeoutError, ProtocolError)
+
+def is_stale_connection_error(error: BaseException) -> bool:
+    """Check whether an error means the client's connections should be discarded."""
+    return isinstance(error, _stale_connection_errors())
+
+@functools.lru_cache(maxsize=1)
+def _get_async_session():
+    """Get the aioboto3 session shared by all async clients in this process.
+    
+    Raises:
+        ImportError: If aioboto3 is not installed
+    """
+    try:
+        import aioboto3
+    except ImportError as e:
+        raise ImportError("aioboto3 is required for async chat commands") from e
+    return aioboto3.Session()
+
+def get_async_bedrock_client(
+    aws_access_key_id: Optional[str] = None,
+    aws_secret_access_key: Optional[str] = None,
+    region_name: Optional[str] = None,
+    streaming: bool = False
+):
+    """Get an async AWS Bedrock runtime client.
+    
+    Clients come from one shared aioboto3 session, so credential resolution
+    and service model loading happen once per process.
+    
+    Args:
+        aws_access_key_id: Optional AWS access key ID
+        aws_secret_access_key: Optional AWS secret access key
+        region_name: Optional AWS region name
+        streaming: Whether the client is for the streaming commands, which
+            handle throttling retries themselves
+    
+    Returns:
+        aioboto3 client context manager, to be used with ``async with``
+    
+    Raises:
+        ImportError: If aioboto3 is not installed
+    """
+    return _get_async_session().client(
+        service_name='bedrock-runtime',
         aws_access_key_id=aws_access_key_id or os.getenv('AWS_ACCESS_KEY_ID'),
         aws_secret_access_key=aws_secret_access_key or os.getenv('AWS_SECRET_ACCESS_KEY'),
-        region_name=region_name or os.getenv('AWS_REGION')
+        region_name=region_name or os.getenv('AWS_REGION'),
+        config=get_client_config(streaming)
     )
+
+def _preload_clients():
+    """Build the default streaming and non-streaming clients ahead of use."""
+    try:
+        get_bedrock_client()
+        get_bedrock_client(streaming=True)
+    except Exception:  # best effort; the first request will report real errors
+        pass
+
+# Opt-in: build the default clients at import so the first request skips
+# loading the botocore service model
+if os.getenv('BEDROCK_CHAT_PRELOAD') == '1':
+    _preload_clients()
@@ -1,10 +1,20 @@
 """Retry and rate limiting utilities."""
 
+import asyncio
+import functools
 import random
 import time
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 from ..models.model_config import StreamConfig
 
+# Number of precomputed backoff steps; later attempts reuse the last one
+BACKOFF_STEPS = 32
+
+@functools.lru_cache(maxsize=16)
+def _backoff_table(base_delay: float, max_delay: float) -> Tuple[float, ...]:
+    """Get the capped exponential delay for each attempt number."""
+    return tuple(min(base_delay * (1 << attempt), max_delay) for attempt in range(BACKOFF_STEPS))
+
 def calculate_backoff_delay(
     attempt: int,
     base_delay: float = 2.0,
@@ -22,30 +32,111 @@ def calculate_backoff_delay(
     Returns:
         Delay in seconds
     """
-    delay = min(base_delay * (2 ** attempt), max_delay)
+    delay = _backoff_table(base_delay, max_delay)[min(max(attempt, 0), BACKOFF_STEPS - 1)]
     if jitter:
         delay *= (0.5 + random.random())
     return delay
 
-def handle_rate_limit(
+def decorrelated_jitter_delay(
+    previous_delay: Optional[float] = None,
+    base_delay: float = 2.0,
+    max_delay: float = 30.0
+) -> float:
+    """Calculate the next retry delay using decorrelated jitter.
+    
+    Each delay is drawn uniformly between the base delay and three times the
+    previous delay, so concurrent callers spread out instead of retrying in
+    lockstep.
+    
+    Args:
+        previous_delay: Delay used for the previous retry, if any
+        base_delay: Base delay in seconds
+        max_delay: Maximum delay in seconds
+        
+    Returns:
+        Delay in seconds
+    """
+    upper = min(max_delay, (previous_delay or base_delay) * 3)
+    return random.uniform(base_delay, max(base_delay, upper))
+
+def _rate_limit_delay(
     attempt: int,
     config: StreamConfig,
-    print_fn: Optional[Callable[[str], None]] = print
-) -> None:
-    """Handle rate limiting with exponential backoff.
+    print_fn: Optional[Callable[[str], None]],
+    previous_delay: Optional[float],
+    deadline: Optional[float]
+) -> Tuple[float, float]:
+    """Pick the next rate limit delay, cap it at the deadline and report the wait.
     
-    Args:
-        attempt: Current retry attempt
-        config: Stream configuration
-        print_fn: Optional function to print status messages
+    Returns:
+        Tuple of the jittered delay and the time actually left to sleep
     """
-    delay = calculate_backoff_delay(
-        attempt,
+    delay = decorrelated_jitter_delay(
+        previous_delay,
         base_delay=config.base_delay,
         max_delay=config.max_delay
     )
+    sleep_for = delay
+    if deadline is not None:
+        sleep_for = max(0.0, min(delay, deadline - time.monotonic()))
     
     if print_fn:
-        print_fn(f"\n⚠️ Rate limited by AWS. Waiting {delay:.1f}s before retry {attempt}/{config.retry_attempts}...")
+        if sleep_for > 0:
+            print_fn(f"\n⚠️ Rate limited by AWS. Waiting {sleep_for:.1f}s before retry {attempt}/{config.retry_attempts}...")
+        else:
+            print_fn(f"\n⚠️ Rate limited by AWS. Cooldown already elapsed, retrying now ({attempt}/{config.retry_attempts})...")
+    return delay, sleep_for
+
+def handle_rate_limit(
+    attempt: int,
+    config: StreamConfig,
+    print_fn: Optional[Callable[[str], None]] = print,
+    previous_delay: Optional[float] = None,
+    deadline: Optional[float] = None
+) -> float:
+    """Handle rate limiting with decorrelated-jitter backoff.
     
-    time.sleep(delay)
+    Args:
+        attempt: Current retry attempt
+        config: Stream configuration
+        print_fn: Optional function to print status messages
+        previous_delay: Delay returned by the previous call for this request
+        deadline: Optional ``time.monotonic()`` time at which the cooldown ends;
+            the sleep stops there, or is skipped if it has already passed
+        
+    Returns:
+        Jittered delay chosen, to pass as ``previous_delay`` on the next retry.
+        This is returned even when the deadline shortened or skipped the sleep,
+        so the backoff keeps growing across retries.
+    """
+    delay, sleep_for = _rate_limit_delay(attempt, config, print_fn, previous_delay, deadline)
+    if sleep_for > 0:
+        time.sleep(sleep_for)
+    return delay
+
+async def handle_rate_limit_async(
+    attempt: int,
+    config: StreamConfig,
+    print_fn: Optional[Callable[[str], None]] = print,
+    previous_delay: Optional[float] = None,
+    deadline: Optional[float] = None
+) -> float:
+    """Handle rate limiting without blocking the event loop.
+    
+    Args:
+        attempt: Current retry attempt
+        config: Stream configuration
+        print_fn: Optional function to print status messages
+        previous_delay: Delay returned by the previous call for this request
+        deadline: Optional ``time.monotonic()`` time at which the cooldown ends;
+            the sleep stops there, or is skipped if it has already passed
+        
+    Returns:
+        Jittered delay chosen, to pass as ``previous_delay`` on the next retry.
+        This is returned even when the deadline shortened or skipped the sleep,
+        so the backoff keeps growing across retries.
+    """
+    delay, sleep_for = _rate_limit_delay(attempt, config, print_fn, previous_delay, deadline)
+    if sleep_for > 0:
+        await asyncio.sleep(sleep_for)
+    return delay
@@ -0,0 +1,24 @@
+"""JSON serialization utilities, using orjson when available."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+if orjson is not None:
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to JSON bytes."""
+        return orjson.dumps(obj)
+    
+    loads = orjson.loads
+else:
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to JSON bytes."""
+        return json.dumps(obj).encode()
+    
+    def loads(data: Union[bytes, str]) -> Any:
+        """Deserialize JSON bytes or text."""
+        return json.loads(data)
@@ -1,13 +1,234 @@
 """Streaming utilities for AWS Bedrock Chat."""
 
-import json
-from typing import Dict, Any, Generator, Optional, Callable
+from typing import Dict, Any, AsyncGenerator, Generator, Iterable, Iterator, List, Optional, Callable, Tuple
 from ..models.model_config import StreamConfig
+from .serialization import loads
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+# Raw payload markers of chunks that carry no text, so they can skip decoding
+_CLAUDE3_DELTA_PREFIX = b'{"type":"content_block_delta"'
+_EMPTY_CLAUDE3_DELTA_SUFFIX = b'"text":""}}'
+_EMPTY_TITAN_PREFIX = b'{"outputText":""'
+_METRICS_MARKER = b'"amazon-bedrock-invocationMetrics"'
+
+# Key under which Bedrock attaches usage metrics to the final stream chunk
+INVOCATION_METRICS_KEY = 'amazon-bedrock-invocationMetrics'
+
+# Function extracting the text of one decoded chunk in a given stream format
+Extractor = Callable[[Dict[str, Any]], Iterable[str]]
+
+def _chunk_texts(chunk: Dict[str, Any]) -> Iterator[str]:
+    """Extract text from a decoded stream chunk.
+    
+    Args:
+        chunk: Decoded chunk payload
+    
+    Yields:
+        Text content contained in the chunk
+    """
+    # Handle different model response formats
+    if 'completion' in chunk:  # Claude 2 format
+        yield chunk['completion']
+    elif 'type' in chunk:  # Claude 3 streaming format
+        yield from _claude3_texts(chunk)
+    elif 'outputText' in chunk:  # Titan format
+        yield chunk['outputText']
+    elif 'generation' in chunk:  # Llama format
+        yield chunk['generation']
+    elif 'text' in chunk:  # Mistral format
+        yield chunk['text']
+    elif 'outputs' in chunk:  # Generic format
+        for output in chunk['outputs']:
+            yield output.get('text', '')
+
+def _claude3_message_delta(chunk: Dict[str, Any]) -> Iterable[str]:
+    """Extract text from a Claude 3 message_delta event, which rarely has any."""
+    delta = chunk.get('delta')
+    if delta:
+        content = delta.get('content')
+        if content:
+            return (content[0].get('text', ''),)
+    return ()
+
+def _claude3_texts(chunk: Dict[str, Any]) -> Iterable[str]:
+    """Extract text from a Claude 3 messages API stream event."""
+    chunk_type = chunk.get('type')
+    if chunk_type == 'content_block_delta':
+        delta = chunk.get('delta')
+        return (delta.get('text'),) if delta and delta.get('text') else ()
+    if chunk_type == 'message_delta':
+        return _claude3_message_delta(chunk)
+    return ()
+
+def _claude_texts(chunk: Dict[str, Any]) -> Iterable[str]:
+    """Extract text from a Claude 2 completion chunk."""
+    text = chunk.get('completion')
+    return (text,) if text else ()
+
+def _titan_texts(chunk: Dict[str, Any]) -> Iterable[str]:
+    """Extract text from a Titan chunk."""
+    text = chunk.get('outputText')
+    return (text,) if text else ()
+
+def _llama_texts(chunk: Dict[str, Any]) -> Iterable[str]:
+    """Extract text from a Llama chunk."""
+    text = chunk.get('generation')
+    return (text,) if text else ()
+
+def _outputs_texts(chunk: Dict[str, Any]) -> Iterable[str]:
+    """Extract text from a Mistral chunk."""
+    return tuple(output.get('text', '') for output in chunk.get('outputs', ()))
+
+def _text_texts(chunk: Dict[str, Any]) -> Iterable[str]:
+    """Extract text from a chunk with a top-level text field."""
+    text = chunk.get('text')
+    return (text,) if text else ()
+
+def _no_texts(chunk: Dict[str, Any]) -> Iterable[str]:
+    """Extract nothing from a chunk in an unrecognized format."""
+    return ()
+
+# Raw key markers identifying each stream format; the earliest match wins
+_FORMAT_MARKERS = (
+    (b'"completion"', _claude_texts),
+    (b'"type"', _claude3_texts),
+    (b'"outputText"', _titan_texts),
+    (b'"generation"', _llama_texts),
+    (b'"text"', _text_texts),
+    (b'"outputs"', _outputs_texts)
+)
+
+def _sniff_extractor(raw: bytes) -> Extractor:
+    """Pick the extractor for a raw chunk from the first format key it contains.
+    
+    Each search is bounded by the best match so far, so the raw payload is
+    scanned roughly once instead of decoded and probed for every format.
+    """
+    best, extractor = len(raw), _no_texts
+    for marker, candidate in _FORMAT_MARKERS:
+        offset = raw.find(marker, 0, best)
+        if offset != -1:
+            best, extractor = offset, candidate
+    return extractor
+
+# Extractor for each model family; 'generic' detects the format per chunk
+EXTRACTORS: Dict[str, Extractor] = {
+    'claude3': _claude3_texts,
+    'claude': _claude_texts,
+    'titan': _titan_texts,
+    'llama': _llama_texts,
+    'mistral': _outputs_texts,
+    'generic': _chunk_texts
+}
+
+if msgspec is not None:
+    class _Delta(msgspec.Struct):
+        text: str = ''
+    
+    class _StreamChunk(msgspec.Struct):
+        metrics: Optional[Dict[str, Any]] = msgspec.field(default=None, name=INVOCATION_METRICS_KEY)
+    
+    class _Claude3EventDelta(msgspec.Struct):
+        text: Optional[str] = None
+        content: Optional[List[_Delta]] = None
+    
+    class _Claude3Chunk(_StreamChunk):
+        type: str = ''
+        delta: Optional[_Claude3EventDelta] = None
+        
+        def texts(self) -> Tuple[str, ...]:
+            if self.delta is None:
+                return ()
+            if self.type == 'content_block_delta':
+                return (self.delta.text,) if self.delta.text else ()
+            if self.type == 'message_delta' and self.delta.content:
+                return (self.delta.content[0].text,)
+            return ()
+    
+    class _Claude2Chunk(_StreamChunk):
+        completion: Optional[str] = None
+        
+        def texts(self) -> Tuple[str, ...]:
+            return (self.completion,) if self.completion else ()
+    
+    class _TitanChunk(_StreamChunk):
+        output_text: Optional[str] = msgspec.field(default=None, name='outputText')
+        
+        def texts(self) -> Tuple[str, ...]:
+            return (self.output_text,) if self.output_text else ()
+    
+    class _LlamaChunk(_StreamChunk):
+        generation: Optional[str] = None
+        
+        def texts(self) -> Tuple[str, ...]:
+            return (self.generation,) if self.generation else ()
+    
+    class _MistralChunk(_StreamChunk):
+        outputs: List[_Delta] = msgspec.field(default_factory=list)
+        
+        def texts(self) -> Tuple[str, ...]:
+            return tuple(output.text for output in self.outputs)
+    
+    # Decoders for each family's fixed chunk schema, built once and reused
+    _STRUCT_DECODERS: Dict[Extractor, Any] = {
+        _claude3_texts: msgspec.json.Decoder(_Claude3Chunk),
+        _claude_texts: msgspec.json.Decoder(_Claude2Chunk),
+        _titan_texts: msgspec.json.Decoder(_TitanChunk),
+        _llama_texts: msgspec.json.Decoder(_LlamaChunk),
+        _outputs_texts: msgspec.json.Decoder(_MistralChunk)
+    }
+else:  # pragma: no cover - optional dependency
+    _STRUCT_DECODERS = {}
+
+def _event_texts(
+    event: Dict[str, Any],
+    on_metrics: Optional[Callable[[Dict[str, Any]], None]] = None,
+    extractor: Optional[Extractor] = None
+) -> Iterable[str]:
+    """Decode a stream event and extract its text.
+    
+    Args:
+        event: Raw stream event
+        on_metrics: Optional callback receiving Bedrock invocation metrics
+        extractor: Function extracting text from the decoded chunk; detected
+            from the raw payload if not given
+    
+    Returns:
+        Text content contained in the event
+    """
+    raw = event['chunk']['bytes']
+    if raw.startswith(_CLAUDE3_DELTA_PREFIX) and raw.endswith(_EMPTY_CLAUDE3_DELTA_SUFFIX):
+        return ()
+    if raw.startswith(_EMPTY_TITAN_PREFIX) and _METRICS_MARKER not in raw:
+        return ()
+    
+    if extractor is None:
+        extractor = _sniff_extractor(raw)
+    
+    decoder = _STRUCT_DECODERS.get(extractor)
+    if decoder is not None:
+        decoded = decoder.decode(raw)
+        if on_metrics and decoded.metrics is not None:
+            on_metrics(decoded.metrics)
+        return decoded.texts()
+    
+    chunk = loads(raw)
+    if on_metrics and INVOCATION_METRICS_KEY in chunk:
+        on_metrics(chunk[INVOCATION_METRICS_KEY])
+    return extractor(chunk)
 
 def process_stream_chunks(
     response: Dict[str, Any],
     config: StreamConfig,
-    print_fn: Optional[Callable[[str], None]] = print
+    print_fn: Optional[Callable[[str], None]] = print,
+    on_metrics: Optional[Callable[[Dict[str, Any]], None]] = None,
+    extractor: Optional[Extractor] = None,
+    on_chunk: Optional[Callable[[str], None]] = None,
+    log_every: int = 32
 ) -> Generator[str, None, None]:
     """Process streaming response chunks.
     
@@ -15,54 +236,81 @@ def process_stream_chunks(
         response: Bedrock streaming response
         config: Stream configuration
         print_fn: Optional function to print status messages
-        
+        on_metrics: Optional callback receiving Bedrock invocation metrics
+            (token counts and latencies) from the final chunk
+        extractor: Optional text extractor for the stream's format (see
+            ``EXTRACTORS``); the format is detected per chunk if not given
+        on_chunk: Optional callback receiving each text chunk as it is yielded,
+            e.g. to drive a progress display
+        log_every: Number of chunks between progress messages; 0 disables them
+    
     Yields:
         Text content from each chunk
     """
     chunk_count = 0
-    accumulated_text = ""
+    char_count = 0
     
     if print_fn:
         print_fn("\nProcessing stream...")
     
     for event in response.get('body', []):
-        chunk = json.loads(event.get('chunk', {}).get('bytes', b'{}').decode())
         chunk_count += 1
         
-        # Handle different model response formats
-        if 'completion' in chunk:  # Claude 2 format
-            text = chunk['completion']
-            accumulated_text += text
-            yield text
-        elif 'type' in chunk:  # Claude 3 streaming format
-            if chunk['type'] == 'content_block_delta':
-                text = chunk.get('delta', {}).get('text', '')
-                accumulated_text += text
-                yield text
-            elif chunk['type'] == 'message_delta':
-                text = chunk.get('delta', {}).get('content', [{}])[0].get('text', '')
-                accumulated_text += text
-                yield text
-        elif 'outputText' in chunk:  # Titan format
-            text = chunk['outputText']
-            accumulated_text += text
+        for text in _event_texts(event, on_metrics, extractor):
+            char_count += len(text)
+            if on_chunk:
+                on_chunk(text)
             yield text
-        elif 'generation' in chunk:  # Llama format
-            text = chunk['generation']
-            accumulated_text += text
-            yield text
-        elif 'text' in chunk:  # Mistral format
-            text = chunk['text']
-            accumulated_text += text
+        
+        if print_fn and log_every and chunk_count % log_every == 0:
+            print_fn(f"Processed chunks: {chunk_count}")
+    
+    if print_fn:
+        print_fn(f"\n✅ Successfully streamed {char_count} characters in {chunk_count} chunks\n")
+
+async def process_stream_chunks_async(
+    response: Dict[str, Any],
+    config: StreamConfig,
+    print_fn: Optional[Callable[[str], None]] = print,
+    on_metrics: Optional[Callable[[Dict[str, Any]], None]] = None,
+    extractor: Optional[Extractor] = None,
+    on_chunk: Optional[Callable[[str], None]] = None,
+    log_every: int = 32
+) -> AsyncGenerator[str, None]:
+    """Process streaming response chunks from an async (aioboto3) client.
+    
+    Args:
+        response: Bedrock streaming response with an async event stream body
+        config: Stream configuration
+        print_fn: Optional function to print status messages
+        on_metrics: Optional callback receiving Bedrock invocation metrics
+            (token counts and latencies) from the final chunk
+        extractor: Optional text extractor for the stream's format (see
+            ``EXTRACTORS``); the format is detected per chunk if not given
+        on_chunk: Optional callback receiving each text chunk as it is yielded,
+            e.g. to drive a progress display
+        log_every: Number of chunks between progress messages; 0 disables them
+    
+    Yields:
+        Text content from each chunk
+    """
+    chunk_count = 0
+    char_count = 0
+    
+    if print_fn:
+        print_fn("\nProcessing stream...")
+    
+    async for event in response['body']:
+        chunk_count += 1
+        
+        for text in _event_texts(event, on_metrics, extractor):
+            char_count += len(text)
+            if on_chunk:
+                on_chunk(text)
             yield text
-        elif 'outputs' in chunk:  # Generic format
-            for output in chunk['outputs']:
-                text = output.get('text', '')
-                accumulated_text += text
-                yield text
-                
-        if print_fn and chunk_count % 5 == 0:
+        
+        if print_fn and log_every and chunk_count % log_every == 0:
             print_fn(f"Processed chunks: {chunk_count}")
     
     if print_fn:
-        print_fn(f"\n✅ Successfully streamed {len(accumulated_text)} characters in {chunk_count} chunks\n")
+        print_fn(f"\n✅ Successfully streamed {char_count} characters in {chunk_count} chunks\n")
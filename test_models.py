@@ -4,7 +4,7 @@
 import time
 import logging
 from src.bedrock_chat.cli import chat_command
-from src.bedrock_chat.models import get_available_models
+from src.bedrock_chat.models import get_available_models, get_models_by_family
 
 # Configure logging
 logging.basicConfig(
@@ -58,24 +58,7 @@ def main():
     """Main entry point."""
     print("\nStarting model tests...")
     models = get_available_models()
-    
-    results = {
-        'claude': [],
-        'titan': [],
-        'llama': [],
-        'mistral': []
-    }
-    
-    # Group models by type
-    for name, model_id in models.items():
-        if name.startswith('claude-'):
-            results['claude'].append((name, model_id))
-        elif name.startswith('titan-'):
-            results['titan'].append((name, model_id))
-        elif name.startswith('llama-'):
-            results['llama'].append((name, model_id))
-        elif name.startswith('mistral-'):
-            results['mistral'].append((name, model_id))
+    results = get_models_by_family()
     
     # Test each model type
     success_count = 0
@@ -0,0 +1,71 @@
+"""Tests for the response cache module."""
+
+import pytest
+from src.bedrock_chat.cache import ResponseCache, make_cache_key, normalize_prompt
+
+def test_make_cache_key():
+    """Test cache key construction."""
+    key = make_cache_key('test.model', 'Hello  world', max_tokens=100, temperature=0.7)
+    assert key == make_cache_key('test.model', ' Hello world ', max_tokens=100, temperature=0.7)
+    assert key != make_cache_key('test.model', 'Hello world', max_tokens=200, temperature=0.7)
+    assert key != make_cache_key('test.model', 'Hello world', system_prompt='Be helpful')
+    assert normalize_prompt(' a \n b ') == 'a b'
+
+def test_response_cache_exact():
+    """Test exact-match lookups and LRU eviction."""
+    cache = ResponseCache(maxsize=2)
+    assert cache.lookup('test.model', 'Hello') is None
+
+    cache.store('test.model', 'Hello', 'Hi there!')
+    assert cache.lookup('test.model', 'Hello') == 'Hi there!'
+    assert cache.lookup('other.model', 'Hello') is None
+
+    cache.store('test.model', 'One', '1')
+    cache.lookup('test.model', 'Hello')
+    cache.store('test.model', 'Two', '2')
+    assert len(cache) == 2
+    assert cache.lookup('test.model', 'One') is None
+    assert cache.lookup('test.model', 'Hello') == 'Hi there!'
+
+    cache.clear()
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError, match="Cache size must be positive"):
+        ResponseCache(maxsize=0)
+
+def test_response_cache_semantic():
+    """Test similarity fallback for low-temperature requests."""
+    pytest.importorskip('numpy')
+    vectors = {
+        'What is AWS?': [1.0, 0.0, 0.0],
+        'what is aws': [0.99, 0.01, 0.0],
+        'Tell me a joke': [0.0, 1.0, 0.0]
+    }
+    cache = ResponseCache(embed_fn=vectors.__getitem__)
+
+    cache.store('test.model', 'What is AWS?', 'A cloud provider', temperature=0.0)
+    assert cache.lookup('test.model', 'what is aws', temperature=0.0) == 'A cloud provider'
+    assert cache.lookup('test.model', 'Tell me a joke', temperature=0.0) is None
+
+    # Creative requests only use exact matches
+    cache.store('test.model', 'What is AWS?', 'A cloud provider', temperature=0.9)
+    assert cache.lookup('test.model', 'what is aws', temperature=0.9) is None
+
+def test_response_cache_semantic_embeds_once():
+    """Test a semantic miss followed by a store embeds the prompt once."""
+    pytest.importorskip('numpy')
+    vectors = {
+        'What is AWS?': [1.0, 0.0],
+        'Tell me a joke': [0.0, 1.0]
+    }
+    calls = []
+    def embed(prompt):
+        calls.append(prompt)
+        return vectors[prompt]
+    cache = ResponseCache(embed_fn=embed)
+
+    cache.store('test.model', 'What is AWS?', 'A cloud provider', temperature=0.0)
+    assert cache.lookup('test.model', 'Tell me a joke', temperature=0.0) is None
+    cache.store('test.model', 'Tell me a joke', 'Knock knock', temperature=0.0)
+    assert calls == ['What is AWS?', 'Tell me a joke']
+    assert cache.lookup('test.model', 'Tell me  a joke', temperature=0.0) == 'Knock knock'
@@ -2,12 +2,20 @@
 
 import pytest
 import json
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
+from botocore.exceptions import ClientError
+from src.bedrock_chat.cache import ResponseCache
+from src.bedrock_chat.models import get_model_info
 from src.bedrock_chat.cli.chat import (
     ChatHistory,
     format_prompt,
     chat_command,
-    stream_chat_command
+    stream_chat_command,
+    achat_command,
+    astream_chat_command,
+    ChatResult,
+    _StreamOutput,
+    _build_invoke_body
 )
 
 @pytest.fixture
@@ -15,15 +23,15 @@ def mock_bedrock_client():
     """Mock AWS Bedrock client."""
     with patch('src.bedrock_chat.cli.chat.get_bedrock_client') as mock_client:
         # Mock non-streaming response
-        mock_response = Mock()
-        mock_response.get.return_value.read.return_value = '{"completion": "Test response"}'
-        mock_client.return_value.invoke_model.return_value = mock_response
+        mock_body = Mock()
+        mock_body.read.return_value = b'{"content": [{"text": "Test response"}]}'
+        mock_client.return_value.invoke_model.return_value = {'body': mock_body}
         
         # Mock streaming response
         mock_stream = Mock()
         mock_stream.get.return_value = [
-            {'chunk': {'bytes': json.dumps({"completion": "Test"}).encode()}},
-            {'chunk': {'bytes': json.dumps({"completion": " response"}).encode()}}
+            {'chunk': {'bytes': json.dumps({"type": "content_block_delta", "delta": {"text": "Test"}}).encode()}},
+            {'chunk': {'bytes': json.dumps({"type": "content_block_delta", "delta": {"text": " response"}}).encode()}}
         ]
         mock_client.return_value.invoke_model_with_response_stream.return_value = mock_stream
         
@@ -140,4 +148,220 @@ def test_invalid_model():
         chat_command("Hello", "invalid-model")
         
     with pytest.raises(ValueError, match="Unknown model"):
-        stream_chat_command("Hello", "invalid-model") 
\ No newline at end of file
+        stream_chat_command("Hello", "invalid-model") 
+
+def test_chat_command_cache(mock_bedrock_client):
+    """Test repeated requests are served from the response cache."""
+    cache = ResponseCache()
+    first = chat_command("Hello", "claude-sonnet", cache=cache)
+    second = chat_command("Hello", "claude-sonnet", cache=cache)
+    assert first == second
+    assert mock_bedrock_client.return_value.invoke_model.call_count == 1
+
+    # Different parameters miss the cache
+    chat_command("Hello", "claude-sonnet", max_tokens=200, cache=cache)
+    assert mock_bedrock_client.return_value.invoke_model.call_count == 2
+
+@pytest.fixture
+def mock_async_bedrock_client():
+    """Mock aioboto3 Bedrock client."""
+    class AsyncEvents:
+        def __init__(self, events):
+            self.events = iter(events)
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            try:
+                return next(self.events)
+            except StopIteration:
+                raise StopAsyncIteration
+
+    client = AsyncMock()
+    client.invoke_model.return_value = {
+        'body': AsyncMock(read=AsyncMock(return_value=b'{"content": [{"text": "Test response"}]}'))
+    }
+    client.invoke_model_with_response_stream.side_effect = lambda **kwargs: {
+        'body': AsyncEvents([
+            {'chunk': {'bytes': json.dumps({"type": "content_block_delta", "delta": {"text": "Test"}}).encode()}},
+            {'chunk': {'bytes': json.dumps({"type": "content_block_delta", "delta": {"text": " response"}}).encode()}}
+        ])
+    }
+    context = AsyncMock()
+    context.__aenter__.return_value = client
+    with patch('src.bedrock_chat.cli.chat.get_async_bedrock_client', return_value=context):
+        yield client
+
+@pytest.mark.asyncio
+async def test_achat_command(mock_async_bedrock_client):
+    """Test async chat commands."""
+    history = ChatHistory()
+    response = await achat_command("Hello", "claude-sonnet", chat_history=history)
+    assert response == "Test response"
+    assert len(history.messages) == 1
+
+    response = await astream_chat_command("Hello", "claude-sonnet", print_fn=lambda x: None)
+    assert response == "Test response"
+
+    with pytest.raises(ValueError, match="Unknown model"):
+        await achat_command("Hello", "invalid-model")
+
+def test_chat_history_limit():
+    """Test chat history evicts the oldest messages."""
+    history = ChatHistory(max_messages=3)
+    for i in range(5):
+        history.add_message("user", str(i))
+    assert [msg["content"] for msg in history.messages] == ["2", "3", "4"]
+    assert [msg["content"] for msg in history.get_context(max_messages=2)] == ["3", "4"]
+    assert len(history.get_context(max_messages=10)) == 3
+
+def test_format_prompt_flatten():
+    """Test flattened prompts match the joined message list."""
+    history = ChatHistory()
+    history.add_message("user", "Previous message")
+    history.add_message("assistant", "Previous response")
+
+    messages = format_prompt("Hello", system_prompt="Be helpful", chat_history=history)
+    flat = format_prompt("Hello", system_prompt="Be helpful", chat_history=history, flatten=True)
+    assert flat == "\n".join(msg["content"] for msg in messages)
+    assert format_prompt("Hello", system_prompt="Be helpful", flatten=True) == "Be helpful\nHello"
+    assert format_prompt("Hello", flatten=True) == "Hello"
+
+    # Joined context is cached until the history changes
+    joined = history.joined("Be helpful")
+    assert history.joined("Be helpful") is joined
+    history.add_message("user", "Another message")
+    assert history.joined("Be helpful").endswith("Another message")
+    assert history.joined() == "Previous message\nPrevious response\nAnother message"
+
+def test_stream_chat_command_throttling(mock_bedrock_client):
+    """Test streaming retries throttled requests with the same serialized body."""
+    throttled = ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+        "InvokeModelWithResponseStream"
+    )
+    invoke = mock_bedrock_client.return_value.invoke_model_with_response_stream
+    stream = invoke.return_value
+    invoke.side_effect = [throttled, stream]
+
+    with patch('src.bedrock_chat.cli.chat.handle_rate_limit') as mock_rate_limit:
+        response = stream_chat_command("Hello", "claude-sonnet", print_fn=lambda x: None)
+    assert response == "Test response"
+    assert mock_rate_limit.call_count == 1
+    assert invoke.call_args_list[0].kwargs['body'] is invoke.call_args_list[1].kwargs['body']
+
+    # Other errors are not retried
+    invoke.side_effect = ClientError(
+        {"Error": {"Code": "ValidationException", "Message": "ThrottlingException"}},
+        "InvokeModelWithResponseStream"
+    )
+    invoke.reset_mock()
+    with pytest.raises(RuntimeError, match="AWS API error"):
+        stream_chat_command("Hello", "claude-sonnet", print_fn=lambda x: None)
+    assert invoke.call_count == 1
+
+def test_build_invoke_body():
+    """Test all chat commands share one body construction path."""
+    model_info, body = _build_invoke_body("claude-sonnet", "Hello", 50, 0.5, system_prompt="Be brief")
+    assert model_info.family == "claude3"
+    assert body["max_tokens"] == 50
+    assert body["messages"][-1] == {"role": "user", "content": "Hello"}
+
+    # Text-completion models receive a flattened prompt
+    model_info, body = _build_invoke_body("titan-express", "Hello", 50, 0.5, system_prompt="Be brief")
+    assert model_info.family == "titan"
+    assert body["inputText"] == "Be brief\nHello"
+
+    with pytest.raises(ValueError, match="Unknown model"):
+        _build_invoke_body("invalid-model", "Hello", 50, 0.5)
+
+def test_chat_command_pre_resolved_model(mock_bedrock_client):
+    """Test a pre-resolved model skips the registry lookup."""
+    model_info = get_model_info("claude-sonnet")
+    with patch('src.bedrock_chat.cli.chat.get_model_info') as mock_lookup:
+        response = chat_command("Hello", "claude-sonnet", model_info=model_info)
+    assert response == "Test response"
+    mock_lookup.assert_not_called()
+
+def test_chat_result_usage(mock_bedrock_client):
+    """Test responses carry server-reported token usage."""
+    body = b'{"content": [{"text": "Test response"}], "usage": {"input_tokens": 12, "output_tokens": 3}}'
+    mock_bedrock_client.return_value.invoke_model.return_value = {'body': Mock(read=Mock(return_value=body))}
+    response = chat_command("Hello", "claude-sonnet")
+    assert isinstance(response, ChatResult)
+    assert response == "Test response"
+    assert type(response.text) is str
+    assert (response.prompt_tokens, response.completion_tokens, response.total_tokens) == (12, 3, 15)
+    assert response.latency_s >= 0
+
+    # Models without usage in the body fall back to the token-count headers
+    mock_bedrock_client.return_value.invoke_model.return_value = {
+        'body': Mock(read=Mock(return_value=b'{"outputs": [{"text": "Bonjour"}]}')),
+        'ResponseMetadata': {'HTTPHeaders': {
+            'x-amzn-bedrock-input-token-count': '7',
+            'x-amzn-bedrock-output-token-count': '2'
+        }}
+    }
+    response = chat_command("Hello", "mistral-7b")
+    assert response == "Bonjour"
+    assert (response.prompt_tokens, response.completion_tokens) == (7, 2)
+
+    # Streaming reads the invocation metrics from the final chunk
+    mock_bedrock_client.return_value.invoke_model_with_response_stream.return_value.get.return_value = [
+        {'chunk': {'bytes': json.dumps({"type": "content_block_delta", "delta": {"text": "Test"}}).encode()}},
+        {'chunk': {'bytes': json.dumps({
+            "type": "message_stop",
+            "amazon-bedrock-invocationMetrics": {"inputTokenCount": 5, "outputTokenCount": 2}
+        }).encode()}}
+    ]
+    response = stream_chat_command("Hello", "claude-sonnet", print_fn=lambda x: None)
+    assert response == "Test"
+    assert (response.prompt_tokens, response.completion_tokens) == (5, 2)
+
+def test_chat_command_injected_client():
+    """Test a caller-provided client is used instead of the shared one."""
+    client = Mock()
+    client.invoke_model.return_value = {
+        'body': Mock(read=Mock(return_value=b'{"content": [{"text": "Injected"}]}'))
+    }
+    with patch('boto3.client') as mock_boto3_client:
+        response = chat_command("Hello", "claude-sonnet", client=client)
+    assert response == "Injected"
+    client.invoke_model.assert_called_once()
+    mock_boto3_client.assert_not_called()
+
+def test_stream_chat_command_single_retry_layer():
+    """Test a throttled stream is retried by the command only, not also by botocore."""
+    from botocore.awsrequest import AWSResponse
+    from src.bedrock_chat.utils.client import _build_client
+
+    def error_response(status, code):
+        raw = Mock()
+        raw.stream.return_value = [json.dumps({"message": code}).encode()]
+        return AWSResponse('https://bedrock', status, {'x-amzn-ErrorType': code}, raw)
+
+    client = _build_client('key', 'secret', 'us-east-1', True)
+    responses = [error_response(429, 'ThrottlingException'), error_response(400, 'ValidationException')]
+    with patch('botocore.endpoint.Endpoint._send', side_effect=responses) as mock_send, \
+            patch('src.bedrock_chat.cli.chat.handle_rate_limit') as mock_rate_limit:
+        with pytest.raises(RuntimeError, match="ValidationException"):
+            stream_chat_command("Hello", "claude-sonnet", print_fn=None, client=client)
+    assert mock_send.call_count == 2
+    assert mock_rate_limit.call_count == 1
+
+def test_stream_output():
+    """Test streamed text is written through and returned on finish."""
+    with patch('src.bedrock_chat.cli.chat.sys.stdout') as stdout, \
+            patch('src.bedrock_chat.cli.chat.STREAM_FLUSH_INTERVAL', 3600):
+        output = _StreamOutput(chunk_size=4)
+        output.write("Hi")
+        assert stdout.flush.call_count == 0
+        output.write(" there")
+        assert stdout.flush.call_count == 1
+        output.write("!")
+        assert output.finish() == "Hi there!"
+        assert stdout.flush.call_count == 2
+    
+    written = [call.args[0] for call in stdout.write.call_args_list]
+    assert written == ["\nResponse: ", "Hi", " there", "!"]
@@ -67,10 +67,10 @@ def test_model_config_request_body():
     # Test Titan model
     config = ModelConfig.from_model_name('titan-express')
     body = config.to_request_body()
-    assert body['maxTokenCount'] == 100
-    assert body['temperature'] == 0.7
-    assert body['topP'] == 1.0
-    assert body['stopSequences'] == []
+    assert body['textGenerationConfig']['maxTokenCount'] == 100
+    assert body['textGenerationConfig']['temperature'] == 0.7
+    assert body['textGenerationConfig']['topP'] == 1.0
+    assert body['textGenerationConfig']['stopSequences'] == []
 
     # Test Llama model
     config = ModelConfig.from_model_name('llama-70b')
@@ -87,6 +87,10 @@ def test_model_config_request_body():
     assert body['top_p'] == 1.0
     assert body['stop'] == []
 
+    # Test config built directly from a known model ID
+    config = ModelConfig(model_id='anthropic.claude-3-haiku-20240307-v1:0')
+    assert config.to_request_body()['anthropic_version'] == 'bedrock-2023-05-31'
+
     # Test unsupported model
     config = ModelConfig(model_id='unsupported.model')
     with pytest.raises(ValueError, match="Unsupported model: unsupported.model"):
@@ -124,4 +128,57 @@ def test_stream_config_validation():
 
     # Test invalid throttle cooldown
     with pytest.raises(ValueError, match="Throttle cooldown must be non-negative"):
-        StreamConfig(throttle_cooldown=-1) 
\ No newline at end of file
+        StreamConfig(throttle_cooldown=-1) 
+
+def test_model_config_request_body_prompt():
+    """Test injecting prompts into request bodies."""
+    messages = [
+        {"role": "system", "content": "Be helpful"},
+        {"role": "user", "content": "Hello"}
+    ]
+
+    # Test Claude 3 model
+    config = ModelConfig.from_model_name('claude-sonnet')
+    assert config.to_request_body("Hello")['messages'] == [{"role": "user", "content": "Hello"}]
+    assert config.to_request_body(messages)['messages'] == messages
+
+    # Test Titan model
+    config = ModelConfig.from_model_name('titan-express')
+    assert config.to_request_body("Hello")['inputText'] == "Hello"
+    assert config.to_request_body(messages)['inputText'] == "Be helpful\nHello"
+
+    # Test Llama model
+    config = ModelConfig.from_model_name('llama-70b')
+    assert config.to_request_body("Hello")['prompt'] == "[INST] Hello [/INST]"
+    assert config.to_request_body(messages)['prompt'] == "[INST] Be helpful\n\nHello [/INST]"
+
+    # Test Mistral model
+    config = ModelConfig.from_model_name('mistral-large')
+    assert config.to_request_body(messages)['prompt'] == "Be helpful\nHello"
+
+def test_model_config_immutable():
+    """Test model configs are frozen and hashable."""
+    config = ModelConfig.from_model_name('claude-haiku', stop_sequences=['\n\n'])
+    assert config.stop_sequences == ('\n\n',)
+    assert config.to_request_body()['stop_sequences'] == ['\n\n']
+    assert hash(config) == hash(ModelConfig.from_model_name('claude-haiku', stop_sequences=['\n\n']))
+    with pytest.raises(AttributeError):
+        config.temperature = 0.5
+
+    # Validation still applies on the from_model_name path
+    with pytest.raises(ValueError, match="Temperature must be between 0 and 1"):
+        ModelConfig.from_model_name('claude-haiku', temperature=1.5)
+    with pytest.raises(TypeError, match="bogus"):
+        ModelConfig.from_model_name('claude-haiku', bogus=1)
+
+def test_model_config_request_body_independent():
+    """Test request bodies are not shared between calls."""
+    config = ModelConfig.from_model_name('titan-express')
+    body = config.to_request_body("Hello")
+    body['textGenerationConfig']['stopSequences'].append('STOP')
+    body['textGenerationConfig']['maxTokenCount'] = 1
+
+    body = config.to_request_body()
+    assert body['inputText'] == ""
+    assert body['textGenerationConfig']['stopSequences'] == []
+    assert body['textGenerationConfig']['maxTokenCount'] == 100
@@ -1,10 +1,15 @@
 """Tests for the model registry module."""
 
 import pytest
+from collections.abc import Mapping
 from src.bedrock_chat.models.model_registry import (
+    MODEL_REGISTRY,
     get_model_info,
     get_model_id,
+    get_model_family,
     get_available_models,
+    get_models_by_family,
+    is_known_model_id,
     ModelInfo
 )
 
@@ -17,6 +22,7 @@ def test_get_model_info_valid():
     assert info.api_version == 'bedrock-2023-05-31'
     assert info.context_window == 200000
     assert info.supports_streaming is True
+    assert info.family == 'claude3'
 
     # Test Titan model
     info = get_model_info('titan-express')
@@ -64,7 +70,8 @@ def test_get_model_id_invalid():
 def test_get_available_models():
     """Test getting all available models."""
     models = get_available_models()
-    assert isinstance(models, dict)
+    assert isinstance(models, Mapping)
+    assert get_available_models() is models
     assert len(models) > 0
     
     # Check for presence of models from each provider
@@ -77,4 +84,40 @@ def test_get_available_models():
     assert models['claude-sonnet'] == 'anthropic.claude-3-sonnet-20240229-v1:0'
     assert models['titan-express'] == 'amazon.titan-text-express-v1'
     assert models['llama-70b'] == 'meta.llama3-70b-instruct-v1:0'
-    assert models['mistral-large'] == 'mistral.mistral-large-2402-v1:0' 
\ No newline at end of file
+    assert models['mistral-large'] == 'mistral.mistral-large-2402-v1:0' 
+
+def test_get_model_family():
+    """Test classifying model IDs by request format family."""
+    assert get_model_family('anthropic.claude-3-sonnet-20240229-v1:0') == 'claude3'
+    assert get_model_family('anthropic.claude-v2:1') == 'claude'
+    assert get_model_family('amazon.titan-text-express-v1') == 'titan'
+    assert get_model_family('meta.llama3-70b-instruct-v1:0') == 'llama'
+    assert get_model_family('mistral.mistral-large-2402-v1:0') == 'mistral'
+    assert get_model_family('unsupported.model') is None
+
+def test_model_registry_read_only():
+    """Test the registry cannot be modified at runtime."""
+    with pytest.raises(TypeError):
+        MODEL_REGISTRY['new-model'] = MODEL_REGISTRY['claude-sonnet']
+    assert 'new-model' not in MODEL_REGISTRY
+
+def test_is_known_model_id():
+    """Test checking full model IDs against the registry."""
+    assert is_known_model_id('anthropic.claude-3-sonnet-20240229-v1:0')
+    assert is_known_model_id('mistral.mixtral-8x7b-instruct-v0:1')
+    assert not is_known_model_id('claude-sonnet')
+    assert not is_known_model_id('anthropic.claude-v2:1')
+
+def test_model_info_immutable():
+    """Test model information cannot be modified."""
+    info = get_model_info('claude-haiku')
+    with pytest.raises(AttributeError):
+        info.context_window = 1
+    assert not hasattr(info, '__dict__')
+
+def test_get_models_by_family():
+    """Test models are grouped by family in registry order."""
+    groups = get_models_by_family()
+    assert list(groups) == ['claude', 'titan', 'llama', 'mistral']
+    assert groups['claude'][0] == ('claude-sonnet', 'anthropic.claude-3-sonnet-20240229-v1:0')
+    assert sum(len(models) for models in groups.values()) == len(get_available_models())
@@ -0,0 +1,276 @@
+"""Tests for the client, retry and streaming utilities."""
+
+import json
+import sys
+import time
+import pytest
+from unittest.mock import Mock, patch
+from src.bedrock_chat.models.model_config import StreamConfig
+from src.bedrock_chat.utils.client import (
+    _build_client,
+    _get_async_session,
+    _preload_clients,
+    get_async_bedrock_client,
+    get_bedrock_client,
+    get_client_config,
+    invalidate_runtime_client,
+    is_stale_connection_error
+)
+from src.bedrock_chat.utils.retry import (
+    calculate_backoff_delay,
+    decorrelated_jitter_delay,
+    handle_rate_limit,
+    handle_rate_limit_async
+)
+from src.bedrock_chat.utils.streaming import EXTRACTORS, process_stream_chunks
+
+@pytest.fixture
+def mock_boto3_client():
+    """Mock boto3 client construction with a fresh client cache."""
+    _build_client.cache_clear()
+    with patch('boto3.client') as mock_client:
+        mock_client.side_effect = lambda **kwargs: object()
+        yield mock_client
+    _build_client.cache_clear()
+
+def test_get_bedrock_client_reuses_client(mock_boto3_client):
+    """Test clients are built once and shared."""
+    client = get_bedrock_client()
+    assert get_bedrock_client() is client
+    assert mock_boto3_client.call_count == 1
+    assert mock_boto3_client.call_args.kwargs['config'] is get_client_config()
+
+    # Streaming clients leave throttling retries to the streaming commands
+    streaming = get_bedrock_client(streaming=True)
+    assert mock_boto3_client.call_args.kwargs['config'] is get_client_config(streaming=True)
+    assert get_client_config(streaming=True).retries == {"mode": "standard", "total_max_attempts": 1}
+    assert get_client_config().retries["mode"] == "adaptive"
+
+    # Different arguments get their own client
+    assert get_bedrock_client(region_name='us-west-2') is not client
+    assert mock_boto3_client.call_count == 3
+
+def test_get_bedrock_client_resolves_defaults(mock_boto3_client, monkeypatch):
+    """Test explicit and environment-provided settings share a client."""
+    monkeypatch.setenv('AWS_REGION', 'us-east-1')
+    assert get_bedrock_client() is get_bedrock_client(region_name='us-east-1')
+    assert mock_boto3_client.call_count == 1
+
+def test_preload_clients(mock_boto3_client):
+    """Test preloading serves both streaming and non-streaming requests from cache."""
+    _preload_clients()
+    assert mock_boto3_client.call_count == 2
+    get_bedrock_client()
+    get_bedrock_client(streaming=True)
+    assert mock_boto3_client.call_count == 2
+
+def test_invalidate_runtime_client(mock_boto3_client):
+    """Test invalidated clients are rebuilt only for their region."""
+    from botocore.exceptions import EndpointConnectionError
+    east = get_bedrock_client(region_name='us-east-1')
+    west = get_bedrock_client(region_name='us-west-2')
+
+    invalidate_runtime_client('us-east-1')
+    assert get_bedrock_client(region_name='us-east-1') is not east
+    assert get_bedrock_client(region_name='us-west-2') is west
+
+    assert is_stale_connection_error(EndpointConnectionError(endpoint_url='https://bedrock'))
+    assert not is_stale_connection_error(ValueError("bad input"))
+
+def test_get_async_bedrock_client_shares_session():
+    """Test async clients are created from one shared session."""
+    aioboto3 = Mock()
+    _get_async_session.cache_clear()
+    with patch.dict(sys.modules, {'aioboto3': aioboto3}):
+        get_async_bedrock_client()
+        get_async_bedrock_client(region_name='us-west-2')
+    _get_async_session.cache_clear()
+    assert aioboto3.Session.call_count == 1
+    assert aioboto3.Session.return_value.client.call_count == 2
+
+def test_calculate_backoff_delay():
+    """Test exponential backoff is capped and jittered around the base schedule."""
+    assert [calculate_backoff_delay(a, 1.0, 10.0, jitter=False) for a in range(6)] == [1, 2, 4, 8, 10, 10]
+    assert calculate_backoff_delay(100, 1.0, 10.0, jitter=False) == 10.0
+    for _ in range(20):
+        assert 2.0 <= calculate_backoff_delay(2, 1.0, 10.0) <= 6.0
+
+def test_decorrelated_jitter_delay():
+    """Test decorrelated jitter stays within bounds."""
+    delay = None
+    for _ in range(20):
+        previous = delay
+        delay = decorrelated_jitter_delay(delay, base_delay=1.0, max_delay=10.0)
+        assert 1.0 <= delay <= min(10.0, (previous or 1.0) * 3)
+
+def test_handle_rate_limit():
+    """Test rate limit handling sleeps and returns the delay used."""
+    config = StreamConfig(base_delay=1.0, max_delay=5.0)
+    with patch('src.bedrock_chat.utils.retry.time.sleep') as mock_sleep:
+        delay = handle_rate_limit(1, config, print_fn=None)
+        mock_sleep.assert_called_once_with(delay)
+        delay = handle_rate_limit(2, config, print_fn=None, previous_delay=delay)
+        assert 1.0 <= delay <= 5.0
+
+        # A cooldown that has already elapsed is not slept again
+        mock_sleep.reset_mock()
+        messages = []
+        handle_rate_limit(3, config, print_fn=messages.append, deadline=time.monotonic() - 1)
+        mock_sleep.assert_not_called()
+        assert messages == ["\n⚠️ Rate limited by AWS. Cooldown already elapsed, retrying now (3/5)..."]
+
+        # A nearer deadline caps the sleep and the reported wait
+        messages.clear()
+        handle_rate_limit(4, config, print_fn=messages.append, deadline=time.monotonic() + 0.5)
+        slept = mock_sleep.call_args.args[0]
+        assert 0 < slept <= 0.5
+        assert messages == [f"\n⚠️ Rate limited by AWS. Waiting {slept:.1f}s before retry 4/5..."]
+
+@pytest.mark.asyncio
+async def test_handle_rate_limit_async():
+    """Test async rate limit handling sleeps without blocking the event loop."""
+    config = StreamConfig(base_delay=1.0, max_delay=5.0)
+    with patch('src.bedrock_chat.utils.retry.asyncio.sleep') as mock_sleep:
+        delay = await handle_rate_limit_async(1, config, print_fn=None)
+        mock_sleep.assert_awaited_once_with(delay)
+        assert 1.0 <= delay <= 5.0
+
+        # The cooldown deadline applies to the async handler as well
+        mock_sleep.reset_mock()
+        messages = []
+        await handle_rate_limit_async(2, config, print_fn=messages.append, deadline=time.monotonic() - 1)
+        mock_sleep.assert_not_awaited()
+        assert messages == ["\n⚠️ Rate limited by AWS. Cooldown already elapsed, retrying now (2/5)..."]
+
+        await handle_rate_limit_async(3, config, print_fn=None, deadline=time.monotonic() + 0.5)
+        assert 0 < mock_sleep.call_args.args[0] <= 0.5
+
+def test_process_stream_chunks_claude3():
+    """Test Claude 3 stream events, including compact deltas and final metrics."""
+    events = [
+        {'chunk': {'bytes': b'{"type":"message_start","message":{"role":"assistant"}}'}},
+        {'chunk': {'bytes': b'{"type":"content_block_delta","index":0,"delta":{"type":"text_delta","text":"Hello"}}'}},
+        {'chunk': {'bytes': json.dumps({"type": "content_block_delta", "delta": {"text": " world"}}).encode()}},
+        {'chunk': {'bytes': json.dumps({
+            "type": "message_stop",
+            "amazon-bedrock-invocationMetrics": {"inputTokenCount": 4, "outputTokenCount": 2}
+        }).encode()}}
+    ]
+    metrics = {}
+    texts = list(process_stream_chunks({'body': events}, StreamConfig(), print_fn=None, on_metrics=metrics.update))
+    assert "".join(texts) == "Hello world"
+    assert metrics == {"inputTokenCount": 4, "outputTokenCount": 2}
+
+@pytest.mark.parametrize("family, payload, expected", [
+    ('claude', {"completion": "Hi"}, ["Hi"]),
+    ('titan', {"outputText": "Hi"}, ["Hi"]),
+    ('llama', {"generation": "Hi"}, ["Hi"]),
+    ('mistral', {"outputs": [{"text": "Hi"}]}, ["Hi"]),
+    ('generic', {"generation": "Hi"}, ["Hi"]),
+    ('claude3', {"type": "message_delta", "delta": {"stop_reason": "end_turn"}}, []),
+    ('claude3', {"type": "message_delta", "delta": {"content": [{"text": "Hi"}]}}, ["Hi"]),
+    ('generic', {"type": "message_delta", "delta": {"stop_reason": "end_turn"}}, [])
+])
+def test_process_stream_chunks_extractors(family, payload, expected):
+    """Test each model family's stream format is extracted by its extractor."""
+    events = [{'chunk': {'bytes': json.dumps(payload).encode()}}]
+    texts = process_stream_chunks({'body': events}, StreamConfig(), print_fn=None, extractor=EXTRACTORS[family])
+    assert list(texts) == expected
+
+def test_process_stream_chunks_detects_format():
+    """Test the stream format is detected from raw payloads when no extractor is given."""
+    payloads = [
+        {"completion": "a", "stop_reason": None},
+        {"outputText": "b", "index": 0},
+        {"generation": "c", "prompt_token_count": None},
+        {"outputs": [{"text": "d", "stop_reason": None}]},
+        {"text": "e"},
+        {"unknown": "f"}
+    ]
+    events = [{'chunk': {'bytes': json.dumps(payload).encode()}} for payload in payloads]
+    assert list(process_stream_chunks({'body': events}, StreamConfig(), print_fn=None)) == list("abcde")
+
+def test_process_stream_chunks_struct_decoders():
+    """Test struct and dict decoding extract the same text and metrics."""
+    cases = [
+        ('claude3', [
+            {"type": "message_start", "message": {"role": "assistant"}},
+            {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "Hi"}},
+            {"type": "message_delta", "delta": {"stop_reason": "end_turn"}},
+            {"type": "message_stop", "amazon-bedrock-invocationMetrics": {"outputTokenCount": 1}}
+        ]),
+        ('claude', [{"completion": "Hi", "stop_reason": None}]),
+        ('titan', [{"outputText": "Hi", "index": 0}]),
+        ('llama', [{"generation": "Hi", "stop_reason": None}]),
+        ('mistral', [{"outputs": [{"text": "Hi", "stop_reason": None}]}])
+    ]
+    for family, payloads in cases:
+        events = [{'chunk': {'bytes': json.dumps(payload).encode()}} for payload in payloads]
+        results = []
+        for use_structs in (False, True):
+            metrics = {}
+            with patch.dict('src.bedrock_chat.utils.streaming._STRUCT_DECODERS', clear=not use_structs):
+                texts = list(process_stream_chunks(
+                    {'body': events},
+                    StreamConfig(),
+                    print_fn=None,
+                    on_metrics=metrics.update,
+                    extractor=EXTRACTORS[family]
+                ))
+            results.append((texts, metrics))
+        assert results[0] == results[1]
+        assert results[0][0] == ["Hi"]
+
+def test_claude3_empty_delta_decoders_agree():
+    """Test an empty Claude 3 delta yields no text on both decoding paths."""
+    events = [{'chunk': {'bytes': b'{"type": "content_block_delta", "delta": {"type": "text_delta", "text": ""}}'}}]
+    for use_structs in (False, True):
+        with patch.dict('src.bedrock_chat.utils.streaming._STRUCT_DECODERS', clear=not use_structs):
+            texts = list(process_stream_chunks(
+                {'body': events},
+                StreamConfig(),
+                print_fn=None,
+                extractor=EXTRACTORS['claude3']
+            ))
+        assert texts == []
+    assert tuple(EXTRACTORS['claude3']({"type": "content_block_delta", "delta": {"type": "text_delta", "text": ""}})) == ()
+
+def test_process_stream_chunks_log_every():
+    """Test progress messages are printed once per log interval."""
+    events = [{'chunk': {'bytes': b'{"generation":"x"}'}}] * 10
+    messages = []
+    list(process_stream_chunks({'body': events}, StreamConfig(), print_fn=messages.append, log_every=4))
+    assert [m for m in messages if m.startswith("Processed chunks")] == ["Processed chunks: 4", "Processed chunks: 8"]
+
+    messages.clear()
+    list(process_stream_chunks({'body': events}, StreamConfig(), print_fn=messages.append, log_every=0))
+    assert not any(m.startswith("Processed chunks") for m in messages)
+
+def test_process_stream_chunks_on_chunk():
+    """Test the chunk observer sees every yielded text."""
+    events = [{'chunk': {'bytes': json.dumps({"generation": text}).encode()}} for text in ("a", "bc")]
+    seen = []
+    texts = process_stream_chunks({'body': events}, StreamConfig(), print_fn=None, on_chunk=seen.append)
+    assert list(texts) == seen == ["a", "bc"]
+
+def test_process_stream_chunks_skips_empty_deltas():
+    """Test empty deltas are skipped without losing the final metrics."""
+    events = [
+        {'chunk': {'bytes': b'{"type":"content_block_delta","index":0,"delta":{"type":"text_delta","text":""}}'}},
+        {'chunk': {'bytes': b'{"outputText":"","index":0}'}},
+        {'chunk': {'bytes': b'{"outputText":"Hi","index":0}'}},
+        {'chunk': {'bytes': b'{"outputText":"","amazon-bedrock-invocationMetrics":{"outputTokenCount":1}}'}}
+    ]
+    metrics = {}
+    with patch('src.bedrock_chat.utils.streaming.loads', wraps=json.loads) as mock_loads, \
+            patch.dict('src.bedrock_chat.utils.streaming._STRUCT_DECODERS', clear=True):
+        texts = list(process_stream_chunks(
+            {'body': events},
+            StreamConfig(),
+            print_fn=None,
+            on_metrics=metrics.update,
+            extractor=EXTRACTORS['titan']
+        ))
+    assert texts == ["Hi"]
+    assert metrics == {"outputTokenCount": 1}
+    assert mock_loads.call_count == 2